@@ -7,7 +7,7 @@ from typing import Dict, Any, List, Optional
 import pytz
 from datetime import datetime
 
-from .indicators import compute_rsi
+from .indicators import compute_rsi, compute_entry_masks
 from .session_clock import SessionClock
 
 
@@ -114,17 +114,12 @@ class BacktestEngine:
         Returns:
             Filtered dataframe with session bars only
         """
-        df = df.copy()
-
-        # Localize timestamps
-        df['timestamp_local'] = df['timestamp'].apply(self.session_clock.localize_timestamp)
-
-        # Filter to session hours
-        df['in_session'] = df['timestamp'].apply(self.session_clock.is_session_open)
-        df = df[df['in_session']].copy()
-
-        # Add entry allowed flag
-        df['entry_allowed'] = df['timestamp'].apply(self.session_clock.is_entry_allowed)
+        # Vectorized session mask + entry_allowed flag (one tz conversion, no per-row apply)
+        df = self.session_clock.filter_dataframe(df)
+        df = df.assign(
+            timestamp_local=self.session_clock.localize_series(df['timestamp']),
+            in_session=True,
+        )
 
         return df.reset_index(drop=True)
 
@@ -189,180 +184,199 @@ class BacktestEngine:
         rsi = compute_rsi(df['close'], self.rsi_period)
         df['rsi'] = rsi
 
-        # Initialize state
+        # Session-local timestamps and trading days (int days since epoch, so
+        # nights held is an int subtraction) computed once instead of every bar
+        bar_local_times = df['timestamp_local'].tolist()
+        bar_local_days = self.session_clock.compute_trading_days(df['timestamp']).tolist()
+
+        # Spread per bar (wider off-hours), same rule as _get_spread_for_time
+        bar_spreads = np.where(
+            df['in_session'].to_numpy(bool), self.spread_pts, self.spread_pts * self.off_hours_spread_mult
+        ).tolist()
+
+        # Last-bar-of-session flags for EOD exits
+        bar_is_eod = self.session_clock.compute_eod_mask(df['timestamp'], bar_duration_minutes=30).tolist()
+
+        # Bar columns as plain lists (no per-row Series construction)
+        bar_timestamps = df['timestamp'].tolist()
+        bar_opens = df['open'].tolist()
+        bar_highs = df['high'].tolist()
+        bar_lows = df['low'].tolist()
+        bar_closes = df['close'].tolist()
+
+        # Per-bar entry conditions computed up front; the loop only runs the
+        # stateful part (seen_oversold/entry_signal are gated by open position)
+        bar_has_rsi, bar_oversold, bar_rebound = compute_entry_masks(
+            df['rsi'], self.oversold, df['entry_allowed']
+        )
+
+        # Config used every bar, read once (trailing arithmetic is open-coded below)
+        half_spread = self.spread_pts / 2
+        use_trailing_stop = self.use_trailing_stop
+        trailing_activation = self.trailing_stop_activation
+        trailing_distance = self.trailing_stop_distance
+        max_hold_days = self.max_hold_days
+        force_eod_exit = self.force_eod_exit
+
+        # Initialize state (open position kept in plain locals, no per-bar dict lookups)
         seen_oversold = False
-        position = None
+        in_position = False
+        entry_bar = -1
+        entry_time_str = ''
+        entry_price = highest_bid = sl_level = 0.0
+        entry_date = -1
+        bars_held = days_held = 0
+        trailing_stop_active = False
         trades = []
         current_date = None
         entry_signal = False  # Signal to enter on NEXT bar
 
-        for idx, row in df.iterrows():
-            bar_timestamp = row['timestamp']
-            bar_date = self.session_clock.get_trading_date(bar_timestamp)
+        for bar_i in range(len(bar_timestamps)):
+            bar_timestamp = bar_timestamps[bar_i]
+            bar_date = bar_local_days[bar_i]
 
             # Reset state at start of new trading day
             if current_date is None or bar_date != current_date:
                 current_date = bar_date
-                if position is None:
+                if not in_position:
                     seen_oversold = False
                     entry_signal = False
 
             # Skip if RSI not available
-            if pd.isna(row['rsi']):
+            if not bar_has_rsi[bar_i]:
                 continue
 
             # === ENTRY LOGIC ===
             # Check for oversold condition (RSI <= threshold)
-            if row['rsi'] <= self.oversold:
+            if bar_oversold[bar_i]:
                 seen_oversold = True
 
             # Detect entry signal: RSI crosses above threshold after being oversold
             # Signal is generated at bar CLOSE (when RSI is calculated)
-            if (position is None and
+            if (not in_position and
                 not entry_signal and
                 seen_oversold and
-                row['rsi'] > self.oversold and
-                row['entry_allowed']):
+                bar_rebound[bar_i]):
 
                 # Mark entry signal for NEXT bar
                 entry_signal = True
                 seen_oversold = False  # Reset after signal
 
             # Execute entry on NEXT bar (realistic: no look-ahead)
-            elif entry_signal and position is None:
+            elif entry_signal and not in_position:
                 # Enter at NEXT bar's open + half spread (ask price)
                 # This is realistic: signal generated at previous bar close, enter at this bar open
-                entry_price = row['open'] + (self.spread_pts / 2)
-
-                position = {
-                    'entry_price': entry_price,
-                    'entry_time': bar_timestamp,
-                    'entry_time_local': self.session_clock.localize_timestamp(bar_timestamp),
-                    'entry_date': self.session_clock.localize_timestamp(bar_timestamp).date(),  # For overnight tracking
-                    'tp_pts': tp_pts,
-                    'sl_pts': self.stop_loss_pts,
-                    'bars_held': 0,
-                    'days_held': 0,  # Track days for overnight charges
-                    'overnight_charges_pts': 0.0,  # Accumulated overnight funding charges
-                    'highest_bid': entry_price,  # Track highest price for trailing stop
-                    'trailing_stop_active': False,  # Trailing stop activation flag
-                    'trailing_sl_level': entry_price - self.stop_loss_pts  # Initialize with fixed SL
-                }
+                entry_price = bar_opens[bar_i] + half_spread
+
+                in_position = True
+                entry_bar = bar_i
+                entry_time_str = bar_local_times[bar_i].strftime('%Y-%m-%d %H:%M:%S')  # Formatted once
+                entry_date = bar_date  # For overnight tracking
+                bars_held = 0
+                days_held = 0  # Nights held (overnight charges computed at exit)
+                highest_bid = entry_price  # Track highest price for trailing stop
+                trailing_stop_active = False  # Trailing stop activation flag
+                sl_level = entry_price - self.stop_loss_pts  # Initialize with fixed SL
 
                 entry_signal = False  # Reset signal
 
             # === EXIT LOGIC ===
-            if position is not None:
-                position['bars_held'] += 1
-
-                # Track overnight holds and charges
-                current_date = self.session_clock.localize_timestamp(bar_timestamp).date()
-                if current_date != position['entry_date']:
-                    # Day changed - calculate days held
-                    days_diff = (current_date - position['entry_date']).days
-                    if days_diff > position['days_held']:
-                        # New overnight period - calculate charges
-                        nights_to_charge = days_diff - position['days_held']
-                        charge = self._calculate_overnight_charge(position['entry_price'], nights_to_charge)
-                        position['overnight_charges_pts'] += charge
-                        position['days_held'] = days_diff
+            if in_position:
+                bars_held += 1
+
+                # Track overnight holds (calendar days since entry)
+                days_held = bar_date - entry_date
 
                 # Initialize exit variables
                 exit_price = None
                 exit_reason = None
 
                 # Check max hold days limit (if set)
-                if self.max_hold_days > 0 and position['days_held'] >= self.max_hold_days:
+                if max_hold_days > 0 and days_held >= max_hold_days:
                     # Force exit due to max hold period
-                    exit_price = row['close'] - (self.spread_pts / 2)
+                    exit_price = bar_closes[bar_i] - half_spread
                     exit_reason = 'MAX_HOLD_DAYS'
 
                 # Get current spread (may be wider during off-hours)
-                current_spread = self._get_spread_for_time(bar_timestamp)
+                current_spread = bar_spreads[bar_i]
 
                 # Get bid prices from bar high/low (mid - spread/2)
                 # Use current spread instead of fixed spread
-                bid_high = row['high'] - (current_spread / 2)
-                bid_low = row['low'] - (current_spread / 2)
+                bid_high = bar_highs[bar_i] - (current_spread / 2)
+                bid_low = bar_lows[bar_i] - (current_spread / 2)
 
                 # Calculate TP level (fixed)
-                tp_level = position['entry_price'] + tp_pts
+                tp_level = entry_price + tp_pts
 
                 # Update highest bid reached (for trailing stop)
-                if bid_high > position['highest_bid']:
-                    position['highest_bid'] = bid_high
+                if bid_high > highest_bid:
+                    highest_bid = bid_high
 
                 # Trailing stop logic (only if enabled in config)
-                if self.use_trailing_stop:
+                if use_trailing_stop:
                     # Calculate profit so far
-                    current_profit = position['highest_bid'] - position['entry_price']
+                    current_profit = highest_bid - entry_price
 
                     # Activate trailing stop if profit threshold reached
-                    if not position['trailing_stop_active'] and current_profit >= self.trailing_stop_activation:
-                        position['trailing_stop_active'] = True
+                    if not trailing_stop_active and current_profit >= trailing_activation:
+                        trailing_stop_active = True
 
                     # Update trailing SL if active
-                    if position['trailing_stop_active']:
+                    if trailing_stop_active:
                         # Trailing SL = highest_bid - trailing_distance
-                        new_trailing_sl = position['highest_bid'] - self.trailing_stop_distance
+                        new_trailing_sl = highest_bid - trailing_distance
                         # Only move SL up, never down
-                        if new_trailing_sl > position['trailing_sl_level']:
-                            position['trailing_sl_level'] = new_trailing_sl
-                else:
-                    # Fixed SL (original behavior)
-                    position['trailing_sl_level'] = position['entry_price'] - self.stop_loss_pts
-
-                # Current SL level (trailing or fixed)
-                sl_level = position['trailing_sl_level']
+                        if new_trailing_sl > sl_level:
+                            sl_level = new_trailing_sl
+                # else: fixed SL (entry_price - stop_loss_pts, set at entry)
 
                 # Check SL first (conservative: SL before TP if both hit same bar)
                 # SL hit if bid_low <= sl_level
                 if bid_low <= sl_level:
                     exit_price = sl_level
-                    exit_reason = 'TRAILING_SL' if (self.use_trailing_stop and position['trailing_stop_active']) else 'SL'
+                    exit_reason = 'TRAILING_SL' if (use_trailing_stop and trailing_stop_active) else 'SL'
                 # Then check TP: TP hit if bid_high >= tp_level
                 elif bid_high >= tp_level:
                     exit_price = tp_level
                     exit_reason = 'TP'
 
                 # Check for EOD exit (respects force_eod_exit flag)
-                if exit_price is None and self.force_eod_exit:
-                    is_eod = self.session_clock.is_eod_bar(bar_timestamp, bar_duration_minutes=30)
-                    if is_eod:
+                if exit_price is None and force_eod_exit:
+                    if bar_is_eod[bar_i]:
                         # Exit at close - half spread (bid price)
                         # Use current spread (may be wider at EOD)
-                        exit_price = row['close'] - (current_spread / 2)
+                        exit_price = bar_closes[bar_i] - (current_spread / 2)
                         exit_reason = 'EOD'
 
                 # Close position if exit triggered
                 if exit_price is not None:
                     # Calculate P&L before overnight charges
-                    pnl_pts_gross = exit_price - position['entry_price']
+                    pnl_pts_gross = exit_price - entry_price
 
                     # Subtract overnight charges from P&L
-                    overnight_charges = position['overnight_charges_pts']
+                    overnight_charges = self._calculate_overnight_charge(entry_price, days_held)
                     pnl_pts_net = pnl_pts_gross - overnight_charges
                     pnl_gbp = pnl_pts_net * self.size_gbp_per_point
 
                     trade = {
-                        'datetime_open': position['entry_time'],
-                        'ny_time_open': position['entry_time_local'].strftime('%Y-%m-%d %H:%M:%S'),
-                        'entry_price': position['entry_price'],
-                        'tp_pts': position['tp_pts'],
-                        'sl_pts': position['sl_pts'],
+                        'datetime_open': bar_timestamps[entry_bar],
+                        'ny_time_open': entry_time_str,
+                        'entry_price': entry_price,
+                        'tp_pts': tp_pts,
+                        'sl_pts': self.stop_loss_pts,
                         'datetime_close': bar_timestamp,
-                        'ny_time_close': self.session_clock.localize_timestamp(bar_timestamp).strftime('%Y-%m-%d %H:%M:%S'),
+                        'ny_time_close': bar_local_times[bar_i].strftime('%Y-%m-%d %H:%M:%S'),
                         'exit_price': exit_price,
                         'exit_reason': exit_reason,
                         'pnl_pts': pnl_pts_net,  # Net P&L after overnight charges
                         'pnl_pts_gross': pnl_pts_gross,  # Gross P&L before charges
                         'overnight_charges': overnight_charges,  # Overnight funding charges
-                        'days_held': position['days_held'],  # Days position was held
+                        'days_held': days_held,  # Days position was held
                         'pnl_gbp': pnl_gbp,
-                        'bars_held': position['bars_held']
+                        'bars_held': bars_held
                     }
 
                     trades.append(trade)
-                    position = None
+                    in_position = False
 
         return trades
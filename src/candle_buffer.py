@@ -0,0 +1,110 @@
+"""Columnar candle storage for the live strategy."""
+
+from datetime import datetime
+from typing import Dict, Any, List
+
+import numpy as np
+import pandas as pd
+
+
+class CandleBuffer:
+    """
+    Stores OHLCV candles as one NumPy array per field (SoA).
+
+    Replaces a list of candle dicts: indicator code reads the `close`
+    view directly without per-candle dict lookups. Timestamps are kept
+    as int64 nanoseconds since epoch (UTC).
+    """
+
+    FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, capacity: int = 256):
+        """
+        Initialize empty buffer.
+
+        Args:
+            capacity: Initial number of candle slots (grows as needed)
+        """
+        self._capacity = max(int(capacity), 1)
+        self._timestamps = np.empty(self._capacity, dtype=np.int64)
+        self._columns = {field: np.empty(self._capacity, dtype=np.float64) for field in self.FIELDS}
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size - self._start
+
+    def clear(self):
+        """Remove all candles."""
+        self._start = 0
+        self._size = 0
+
+    def append(self, candle: Dict[str, Any]):
+        """
+        Append candle.
+
+        Args:
+            candle: Candle dict with timestamp, open, high, low, close, volume
+        """
+        if self._size == self._capacity:
+            self._make_room(1)
+
+        i = self._size
+        self._timestamps[i] = pd.Timestamp(candle['timestamp']).value
+        for field in self.FIELDS:
+            self._columns[field][i] = candle.get(field, 0.0)
+        self._size += 1
+
+    def extend(self, candles: List[Dict[str, Any]]):
+        """
+        Append candles in order.
+
+        Args:
+            candles: List of candle dicts (oldest first)
+        """
+        if self._size + len(candles) > self._capacity:
+            self._make_room(len(candles))
+
+        for candle in candles:
+            self.append(candle)
+
+    def trim(self, max_len: int):
+        """Keep only the most recent max_len candles (O(1), no copy)."""
+        if len(self) > max_len:
+            self._start = self._size - max_len
+
+    def _make_room(self, needed: int):
+        """Compact live window to the front, growing arrays if still too small."""
+        n = len(self)
+        if n + needed > self._capacity // 2:
+            self._capacity = max(self._capacity * 2, n + needed)
+
+        timestamps = np.empty(self._capacity, dtype=np.int64)
+        timestamps[:n] = self._timestamps[self._start:self._size]
+        self._timestamps = timestamps
+
+        for field in self.FIELDS:
+            column = np.empty(self._capacity, dtype=np.float64)
+            column[:n] = self._columns[field][self._start:self._size]
+            self._columns[field] = column
+
+        self._start = 0
+        self._size = n
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Candle timestamps as int64 ns since epoch (view)."""
+        return self._timestamps[self._start:self._size]
+
+    @property
+    def close(self) -> np.ndarray:
+        """Close prices (view)."""
+        return self._columns['close'][self._start:self._size]
+
+    def column(self, field: str) -> np.ndarray:
+        """Get any OHLCV field (view)."""
+        return self._columns[field][self._start:self._size]
+
+    def timestamp_at(self, index: int) -> datetime:
+        """Get candle timestamp as UTC datetime (supports negative index)."""
+        return pd.Timestamp(int(self.timestamps[index]), tz='UTC').to_pydatetime()
@@ -114,7 +114,7 @@ class IGStream:
                         self.logger.info(f"Received {self.tick_count} ticks")
 
                     # Debug log individual ticks
-                    self.logger.debug(f"Tick #{self.tick_count}: BID={bid} OFFER={ask} TIME={timestamp}")
+                    self.logger.debug("Tick #%d: BID=%s OFFER=%s TIME=%s", self.tick_count, bid, ask, timestamp)
 
                     if bid and ask:
                         self.callback(float(bid), float(ask), timestamp)
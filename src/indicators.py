@@ -2,7 +2,42 @@
 
 import numpy as np
 import pandas as pd
-from typing import Union
+from typing import Tuple, Union
+
+try:
+    from numba import njit, types
+except ImportError:  # numba is optional - fall back to plain Python
+    njit = None
+
+
+def _wilder_smooth(gains, losses, period, avg_gains, avg_losses):
+    """
+    Fill avg_gains/avg_losses[period + 1:] with Wilder's smoothed averages (in place).
+
+    Starts from the seed already stored at index `period`, then applies
+    new_avg = (1/N) * current + ((N-1)/N) * prev_avg in one pass.
+    """
+    avg_gain = avg_gains[period]
+    avg_loss = avg_losses[period]
+
+    alpha = 1.0 / period
+    for i in range(period + 1, len(avg_gains)):
+        avg_gain = alpha * gains[i - 1] + (1 - alpha) * avg_gain
+        avg_loss = alpha * losses[i - 1] + (1 - alpha) * avg_loss
+        avg_gains[i] = avg_gain
+        avg_losses[i] = avg_loss
+
+
+if njit is not None:
+    # Explicit signature: compiled eagerly (and cached on disk) at import, so
+    # the live strategy's first RSI on a bar close never waits on the JIT
+    _float_array = types.Array(types.float64, 1, 'C')
+    _wilder_smooth_kernel = njit(
+        types.void(_float_array, _float_array, types.int64, _float_array, _float_array),
+        cache=True
+    )(_wilder_smooth)
+else:
+    _wilder_smooth_kernel = _wilder_smooth
 
 
 def compute_rsi(prices: Union[pd.Series, np.ndarray], period: int = 2) -> pd.Series:
@@ -24,36 +59,28 @@ def compute_rsi(prices: Union[pd.Series, np.ndarray], period: int = 2) -> pd.Ser
     if isinstance(prices, np.ndarray):
         prices = pd.Series(prices)
 
-    # Calculate price changes
-    delta = prices.diff()
-
-    # Separate gains and losses
-    gains = delta.where(delta > 0, 0.0)
-    losses = -delta.where(delta < 0, 0.0)
-
-    # Wilder's smoothing method (exponential smoothing with alpha = 1/period)
-    # First, calculate simple average for the first 'period' values
-    avg_gains = pd.Series(index=prices.index, dtype=float)
-    avg_losses = pd.Series(index=prices.index, dtype=float)
+    # Single pass over plain float arrays (no per-element .iloc access)
+    values = prices.to_numpy(dtype=float)
+    n = len(values)
 
-    # Initialize with NaN
-    avg_gains[:] = np.nan
-    avg_losses[:] = np.nan
+    avg_gains = np.full(n, np.nan)
+    avg_losses = np.full(n, np.nan)
 
     # Calculate first average using simple mean
-    if len(gains) >= period + 1:  # +1 because first delta is NaN
-        first_avg_gain = gains.iloc[1:period+1].mean()
-        first_avg_loss = losses.iloc[1:period+1].mean()
+    if n >= period + 1:  # +1 because first delta is NaN
+        # Calculate price changes and separate gains and losses
+        delta = np.diff(values)
+        gains = np.where(delta > 0, delta, 0.0)
+        losses = -np.where(delta < 0, delta, 0.0)
 
-        avg_gains.iloc[period] = first_avg_gain
-        avg_losses.iloc[period] = first_avg_loss
+        avg_gains[period] = gains[:period].mean()
+        avg_losses[period] = losses[:period].mean()
 
-        # Apply Wilder's smoothing for subsequent values
-        # Formula: new_avg = (1/N) * current + ((N-1)/N) * prev_avg
-        alpha = 1.0 / period
-        for i in range(period + 1, len(prices)):
-            avg_gains.iloc[i] = alpha * gains.iloc[i] + (1 - alpha) * avg_gains.iloc[i-1]
-            avg_losses.iloc[i] = alpha * losses.iloc[i] + (1 - alpha) * avg_losses.iloc[i-1]
+        # Apply Wilder's smoothing for subsequent values (compiled single pass)
+        _wilder_smooth_kernel(gains, losses, period, avg_gains, avg_losses)
+
+    avg_gains = pd.Series(avg_gains, index=prices.index)
+    avg_losses = pd.Series(avg_losses, index=prices.index)
 
     # Calculate RS and RSI
     rs = avg_gains / avg_losses
@@ -62,6 +89,28 @@ def compute_rsi(prices: Union[pd.Series, np.ndarray], period: int = 2) -> pd.Ser
     return rsi
 
 
+def compute_entry_masks(rsi: Union[pd.Series, np.ndarray], threshold: float,
+                        entry_allowed: Union[pd.Series, np.ndarray]) -> Tuple[list, list, list]:
+    """
+    Per-bar RSI entry conditions, computed vectorized for the backtest loops.
+
+    Args:
+        rsi: RSI values per bar
+        threshold: Oversold threshold
+        entry_allowed: Per-bar entry window flag
+
+    Returns:
+        Tuple of (has_rsi, oversold, rebound) bool lists where oversold is
+        RSI <= threshold and rebound is RSI > threshold inside the entry window
+    """
+    rsi_values = np.asarray(rsi, dtype=np.float64)
+    has_rsi = ~np.isnan(rsi_values)
+    oversold = rsi_values <= threshold
+    rebound = (rsi_values > threshold) & np.asarray(entry_allowed, dtype=bool)
+
+    return has_rsi.tolist(), oversold.tolist(), rebound.tolist()
+
+
 def detect_oversold_rebound(rsi: pd.Series, threshold: float = 3.0) -> pd.Series:
     """
     Detect RSI rebound signals (crosses up through threshold after being at/under threshold).
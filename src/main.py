@@ -73,9 +73,14 @@ class LiveTrader:
         self.current_deal_id = None
         self.last_trading_date = None
 
-        # Rate limiting for SL updates (prevent API spam)
+        # Rate limiting for SL updates (prevent API spam). Trailing SL moves made
+        # while rate limited are coalesced into one pending level and sent later
         self.last_sl_update_time = 0
-        self.min_sl_update_interval = 2.0  # Minimum 2 seconds between updates
+        self.min_sl_update_interval = config.get('trailing_stop_min_update_ms', 2000) / 1000.0
+        self.min_sl_update_pts = config.get('trailing_stop_min_update_pts', 0.0)
+        self.pending_sl_level = None
+        self.last_sent_sl_level = None
+        self.sl_no_deal_id_warned = False  # Warn once per position, not every loop
 
     def start(self):
         """Start live trading."""
@@ -157,7 +162,7 @@ class LiveTrader:
 
                     if self.strategy.has_position():
                         pos = self.strategy.get_position()
-                        status_msg += f" | Position: {pos['entry_price']:.2f}"
+                        status_msg += f" | Position: {pos.entry_price:.2f}"
                     else:
                         status_msg += " | Position: None"
 
@@ -168,7 +173,9 @@ class LiveTrader:
                 if self.trailing_manager and self.trailing_manager.has_position() and self.current_bid:
                     should_update, new_sl, _ = self.trailing_manager.on_tick(self.current_bid)
                     if should_update and new_sl:
-                        self._update_stop_loss(new_sl)
+                        self.pending_sl_level = new_sl  # Latest level supersedes unsent ones
+                    if self.pending_sl_level is not None:
+                        self._update_stop_loss(self.pending_sl_level)
 
                 # Check for position exits
                 if self.strategy.has_position() and self.current_bid:
@@ -260,6 +267,7 @@ class LiveTrader:
 
         # Print summary
         self.trade_logger.print_summary()
+        self.trade_logger.close()
 
         self.logger.info("Live trading stopped")
 
@@ -335,17 +343,17 @@ class LiveTrader:
             self.current_bid, self.current_ask, 'BUY'
         )
 
-        # Calculate exit levels
-        levels = self.risk_manager.calculate_exit_levels(
-            entry_price, self.tp_pts, 'BUY'
+        # Calculate exit levels (long-only)
+        stop_level, limit_level = self.risk_manager.calculate_exit_levels_long(
+            entry_price, self.tp_pts
         )
 
         # Open position via broker
         deal_ref = self.broker.open_position(
             direction='BUY',
             entry_price=entry_price,
-            stop_level=levels['stop_level'],
-            limit_level=levels['limit_level']
+            stop_level=stop_level,
+            limit_level=limit_level
         )
 
         if deal_ref:
@@ -365,8 +373,8 @@ class LiveTrader:
                 'deal_id': deal_ref,  # Will be updated with real deal_id from stream
                 'deal_ref': deal_ref,
                 'entry_price': entry_price,
-                'tp_level': levels['limit_level'],
-                'sl_level': levels['stop_level'],
+                'tp_level': limit_level,
+                'sl_level': stop_level,
                 'entry_time': datetime.now().isoformat(),
                 'direction': 'BUY'
             }
@@ -374,10 +382,13 @@ class LiveTrader:
 
             # Initialize trailing stop manager (if enabled)
             if self.trailing_manager:
+                self.pending_sl_level = None
+                self.last_sent_sl_level = stop_level
+                self.sl_no_deal_id_warned = False
                 self.trailing_manager.on_position_opened(
                     entry_price=entry_price,
-                    tp_level=levels['limit_level'],
-                    sl_level=levels['stop_level'],
+                    tp_level=limit_level,
+                    sl_level=stop_level,
                     deal_id=deal_ref
                 )
 
@@ -387,11 +398,11 @@ class LiveTrader:
         if not position:
             return
 
-        should_exit, reason = self.risk_manager.check_exit(
-            position, self.current_bid, self.current_ask
+        reason = self.risk_manager.check_exit_long(
+            self.current_bid, position.sl_level, position.tp_level
         )
 
-        if should_exit:
+        if reason is not None:
             self._close_position(self.current_bid, reason)
 
     def _close_position(self, exit_price: float, reason: str):
@@ -423,6 +434,9 @@ class LiveTrader:
         # Reset trailing stop manager
         if self.trailing_manager:
             self.trailing_manager.on_position_closed()
+            self.pending_sl_level = None
+            self.last_sent_sl_level = None
+            self.sl_no_deal_id_warned = False
 
         self.current_deal_ref = None
         self.current_deal_id = None
@@ -487,24 +501,41 @@ class LiveTrader:
         """
         Update stop loss level via broker API.
 
+        Skipped updates (no deal_id yet, rate limited, or a move smaller than
+        trailing_stop_min_update_pts) stay in pending_sl_level and are retried
+        on later loop iterations, so the broker SL never lags behind for good.
+        A level the broker rejects is dropped; only a newer level is sent.
+
         Args:
             new_sl_level: New stop loss level
         """
         if not self.current_deal_id:
-            self.logger.warning("Cannot update SL: no deal_id available")
+            if not self.sl_no_deal_id_warned:
+                self.logger.warning("Cannot update SL: no deal_id available (will send once confirmed)")
+                self.sl_no_deal_id_warned = True
             return
 
         # Rate limiting: prevent API spam
         now = time.time()
         if (now - self.last_sl_update_time) < self.min_sl_update_interval:
-            self.logger.debug(f"Skipping SL update (rate limited): {new_sl_level:.2f}")
+            return
+
+        # Coalesce small moves
+        if (self.last_sent_sl_level is not None and
+                new_sl_level - self.last_sent_sl_level < self.min_sl_update_pts):
             return
 
         success = self.broker.update_stop_level(self.current_deal_id, new_sl_level)
+        self.last_sl_update_time = now  # Failed attempts are rate limited too
+
+        # Sent or rejected, this level is done (rejections such as min stop
+        # distance or a closed deal would fail again on every retry)
+        if self.pending_sl_level == new_sl_level:
+            self.pending_sl_level = None
 
         if success:
             self.logger.info(f"✓ Trailing SL updated: {new_sl_level:.2f}")
-            self.last_sl_update_time = now
+            self.last_sent_sl_level = new_sl_level
         else:
             self.logger.error(f"✗ Failed to update trailing SL to {new_sl_level:.2f}")
 
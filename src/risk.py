@@ -1,7 +1,7 @@
 """Risk management - position sizing and exit levels."""
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 
 class RiskManager:
@@ -62,6 +62,22 @@ class RiskManager:
             'limit_level': limit_level
         }
 
+    def calculate_exit_levels_long(self, entry_price: float, tp_pts: float) -> Tuple[float, float]:
+        """
+        Calculate stop loss and take profit levels for a long position.
+
+        Specialized BUY-only path (strategy is long-only) - no direction
+        branch and no dict allocation.
+
+        Args:
+            entry_price: Entry price (ask)
+            tp_pts: Take profit in points
+
+        Returns:
+            Tuple of (stop_level, limit_level)
+        """
+        return entry_price - self.stop_loss_pts, entry_price + tp_pts
+
     def check_exit(self, position: Dict[str, Any], current_bid: float,
                   current_ask: float) -> tuple[bool, str]:
         """
@@ -76,18 +92,31 @@ class RiskManager:
             Tuple of (should_exit, exit_reason)
         """
         # For long positions, check bid price for exits
-        tp_level = position.get('tp_level')
-        sl_level = position.get('sl_level')
+        exit_reason = self.check_exit_long(
+            current_bid, position.get('sl_level'), position.get('tp_level')
+        )
+        return exit_reason is not None, exit_reason
 
-        # Check stop loss
-        if current_bid <= sl_level:
-            return True, 'SL'
+    @staticmethod
+    def check_exit_long(current_bid: float, sl_level: float, tp_level: float) -> Optional[str]:
+        """
+        Check long position exit against bid price.
 
-        # Check take profit
-        if current_bid >= tp_level:
-            return True, 'TP'
+        SL is checked first (conservative if both are hit).
+
+        Args:
+            current_bid: Current bid price
+            sl_level: Stop loss level
+            tp_level: Take profit level
 
-        return False, None
+        Returns:
+            'SL', 'TP' or None if no exit
+        """
+        if current_bid <= sl_level:
+            return 'SL'
+        if current_bid >= tp_level:
+            return 'TP'
+        return None
 
     def get_position_pnl(self, entry_price: float, current_price: float,
                         direction: str = 'BUY') -> float:
@@ -1,7 +1,9 @@
 """Session timing and trading hours management."""
 
-from datetime import datetime, time, timedelta
-import pytz
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+import numpy as np
+import pandas as pd
 from typing import Dict, Any
 
 
@@ -15,16 +17,25 @@ class SessionClock:
         Args:
             config: Configuration dictionary with tz, session_open, session_close, no_trade_first_minutes
         """
-        self.tz = pytz.timezone(config.get('tz', 'America/New_York'))
+        self.tz = ZoneInfo(config.get('tz', 'America/New_York'))
         self.session_open = self._parse_time(config.get('session_open', '09:30'))
         self.session_close = self._parse_time(config.get('session_close', '16:00'))
         self.no_trade_first_minutes = config.get('no_trade_first_minutes', 30)
 
+        # Single-entry memo for localize_timestamp (same bar timestamp is
+        # typically checked several times in a row). One (dt, dt_local) tuple,
+        # read and replaced in a single step: the clock is shared by the main
+        # loop and the streaming callback thread
+        self._last = (None, None)
+
         # Calculate entry window start time
         entry_start = datetime.combine(datetime.today(), self.session_open)
         entry_start += timedelta(minutes=self.no_trade_first_minutes)
         self.entry_start_time = entry_start.time()
 
+        # Session close as minutes since midnight (for integer EOD checks)
+        self.session_close_minutes = self.session_close.hour * 60 + self.session_close.minute
+
     @staticmethod
     def _parse_time(time_str: str) -> time:
         """Parse time string 'HH:MM' to time object."""
@@ -33,10 +44,48 @@ class SessionClock:
 
     def localize_timestamp(self, dt: datetime) -> datetime:
         """Convert timestamp to session timezone."""
-        if dt.tzinfo is None:
+        last = self._last
+        if dt is last[0]:
+            return last[1]
+
+        dt_utc = dt
+        if dt_utc.tzinfo is None:
             # Assume UTC if no timezone
-            dt = pytz.UTC.localize(dt)
-        return dt.astimezone(self.tz)
+            dt_utc = dt_utc.replace(tzinfo=timezone.utc)
+        dt_local = dt_utc.astimezone(self.tz)
+
+        self._last = (dt, dt_local)
+        return dt_local
+
+    def localize_series(self, timestamps: pd.Series) -> pd.Series:
+        """Convert a datetime Series to session timezone (naive values assumed UTC)."""
+        if timestamps.dt.tz is None:
+            timestamps = timestamps.dt.tz_localize('UTC')
+        return timestamps.dt.tz_convert(self.tz)
+
+    def filter_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized session filter for a DataFrame with a timestamp column.
+
+        Equivalent to applying is_session_open / is_entry_allowed per row.
+
+        Args:
+            df: DataFrame with 'timestamp' column
+
+        Returns:
+            Rows within session hours (original index kept), plus 'entry_allowed' column
+        """
+        # Row positions straight from the session-local index (time-of-day mask built in C)
+        local_index = pd.DatetimeIndex(self.localize_series(df['timestamp']))
+
+        session_rows = local_index.indexer_between_time(
+            self.session_open, self.session_close, include_start=True, include_end=False
+        )
+        entry_rows = local_index.indexer_between_time(
+            self.entry_start_time, self.session_close, include_start=True, include_end=False
+        )
+
+        return df.iloc[session_rows].assign(entry_allowed=np.isin(session_rows, entry_rows))
 
     def is_session_open(self, dt: datetime) -> bool:
         """Check if timestamp is within session hours."""
@@ -64,16 +113,41 @@ class SessionClock:
             True if this is the last eligible bar before session close
         """
         dt_local = self.localize_timestamp(dt)
-        current_time = dt_local.time()
 
-        # Calculate time of next bar
-        next_bar_time = (
-            datetime.combine(datetime.today(), current_time) +
-            timedelta(minutes=bar_duration_minutes)
-        ).time()
+        # Minute-of-day of next bar (wraps at midnight like a wall-clock time)
+        next_bar_minutes = (dt_local.hour * 60 + dt_local.minute + bar_duration_minutes) % 1440
 
         # This is EOD bar if next bar would be at or after session close
-        return next_bar_time >= self.session_close
+        return next_bar_minutes >= self.session_close_minutes
+
+    def compute_eod_mask(self, timestamps: pd.Series, bar_duration_minutes: int = 30) -> np.ndarray:
+        """
+        Vectorized is_eod_bar for a Series of bar timestamps.
+
+        Args:
+            timestamps: Bar timestamps (naive values assumed UTC)
+            bar_duration_minutes: Bar duration in minutes
+
+        Returns:
+            Boolean array, True where the bar is the last one before session close
+        """
+        local = self.localize_series(timestamps)
+        next_bar_minutes = (local.dt.hour * 60 + local.dt.minute + bar_duration_minutes) % 1440
+        return (next_bar_minutes >= self.session_close_minutes).to_numpy(bool)
+
+    def compute_trading_days(self, timestamps: pd.Series) -> np.ndarray:
+        """
+        Vectorized get_trading_date as integer day numbers.
+
+        Args:
+            timestamps: Timestamps (naive values assumed UTC)
+
+        Returns:
+            int64 array of session-local dates as days since 1970-01-01, so
+            differences are calendar days (nights held)
+        """
+        local_dates = self.localize_series(timestamps).dt.tz_localize(None).dt.normalize()
+        return pd.DatetimeIndex(local_dates).as_unit('ns').asi8 // (24 * 60 * 60 * 1_000_000_000)
 
     def get_trading_date(self, dt: datetime) -> datetime:
         """Get the trading date (date in session timezone)."""
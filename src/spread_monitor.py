@@ -2,9 +2,9 @@
 
 import csv
 import logging
-import queue
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -18,6 +18,9 @@ class SpreadMonitor:
     Logs spread data to CSV for historical analysis.
     """
 
+    # timestamp,bid,offer,spread_pts,market_open,notes (csv.writer line ending)
+    _CSV_ROW_TEMPLATE = "{},{:.2f},{:.2f},{:.2f},{},{}\r\n"
+
     def __init__(self, config: dict, epic: str):
         """
         Initialize spread monitor.
@@ -39,13 +42,23 @@ class SpreadMonitor:
         spread_log_dir.mkdir(parents=True, exist_ok=True)
         self.csv_file = spread_log_dir / f"{epic}_spread_log.csv"
 
-        # Thread-safe queue for spread data
-        self.spread_queue = queue.Queue()
+        # Pending spread records as (timestamp, bid, ask, spread, market_open, notes)
+        # tuples. Bounded ring: deque appends/pops are thread-safe (no lock per
+        # tick) and on overflow the oldest record is discarded.
+        self.spread_buffer = deque(maxlen=config.get('spread_buffer_size', 65536))
+        self.flush_batch_size = config.get('spread_flush_batch_size', 16)
+        self.writer_event = threading.Event()
 
         # Current spread tracking
         self.current_spread = None
         self.last_logged_spread = None
-        self.last_log_time = 0
+        self.last_log_tick_secs = None  # Tick clock (seconds of day) of last logged record
+        self.last_log_time = None  # time.monotonic_ns() of last logged record (fallback clock)
+
+        # Scheduled-log clock: the ticks' own UPDATE_TIME, checked every Nth tick
+        self.log_interval_ns = int(self.log_interval * 1_000_000_000)
+        self.clock_check_ticks = config.get('spread_clock_check_ticks', 10)
+        self.ticks_until_clock_check = 0
 
         # Background writer thread
         self.running = False
@@ -97,14 +110,19 @@ class SpreadMonitor:
         spread = ask - bid
         self.current_spread = spread
 
-        current_time = time.time()
+        # Check scheduled-log clock only every Nth tick (no clock read per tick)
+        scheduled_due = False
+        self.ticks_until_clock_check -= 1
+        if self.ticks_until_clock_check <= 0:
+            self.ticks_until_clock_check = self.clock_check_ticks
+            scheduled_due = self._is_scheduled_log_due(timestamp)
 
         # Check if we should log this tick
         should_log = False
         notes = ""
 
         # Log at regular intervals
-        if (current_time - self.last_log_time) >= self.log_interval:
+        if scheduled_due:
             should_log = True
             notes = "scheduled_log"
 
@@ -121,76 +139,117 @@ class SpreadMonitor:
             notes = f"wide_spread_warning_{spread:.2f}pts"
             self.logger.warning(f"Wide spread detected: {spread:.2f} pts (max: {self.max_entry_spread} pts)")
 
-        # Push to queue if should log (non-blocking)
+        # Push to buffer if should log (non-blocking)
         if should_log:
-            try:
-                self.spread_queue.put({
-                    'timestamp': timestamp,
-                    'bid': bid,
-                    'ask': ask,
-                    'spread': spread,
-                    'market_open': is_market_open,
-                    'notes': notes
-                }, block=False)
+            if len(self.spread_buffer) == self.spread_buffer.maxlen:
+                self.logger.warning("Spread buffer full, dropping oldest data point")
+            self.spread_buffer.append((timestamp, bid, ask, spread, is_market_open, notes))
+
+            self.last_log_tick_secs = self._parse_tick_seconds(timestamp)
+            self.last_log_time = time.monotonic_ns()
+            self.last_logged_spread = spread
+
+            # Wake writer early once a full batch is waiting
+            if len(self.spread_buffer) >= self.flush_batch_size:
+                self.writer_event.set()
+
+    @staticmethod
+    def _parse_tick_seconds(timestamp: str) -> Optional[int]:
+        """Parse IG UPDATE_TIME 'HH:MM:SS' to seconds of day (None if not parseable)."""
+        try:
+            hours, minutes, seconds = timestamp.split(':')
+            return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+        except (AttributeError, ValueError):
+            return None
+
+    def _is_scheduled_log_due(self, timestamp: str) -> bool:
+        """
+        Check if log_interval has elapsed since the last logged record.
+
+        Uses the tick timestamp as the clock; if it goes backwards (midnight
+        rollover or an out-of-order UPDATE_TIME) the interval restarts from
+        that tick instead of wrapping. Falls back to the monotonic clock if
+        the timestamp cannot be parsed.
+
+        Args:
+            timestamp: Tick timestamp
+
+        Returns:
+            True if a scheduled log is due
+        """
+        if self.last_log_time is None:
+            return True
 
-                self.last_log_time = current_time
-                self.last_logged_spread = spread
+        tick_secs = self._parse_tick_seconds(timestamp)
+        if tick_secs is not None and self.last_log_tick_secs is not None:
+            elapsed_secs = tick_secs - self.last_log_tick_secs
+            if elapsed_secs < 0:
+                # Clock went backwards: reset the reference, don't log early
+                self.last_log_tick_secs = tick_secs
+                return False
+            return elapsed_secs >= self.log_interval
 
-            except queue.Full:
-                self.logger.warning("Spread queue full, dropping data point")
+        return time.monotonic_ns() - self.last_log_time >= self.log_interval_ns
+
+    def _drain_buffer(self) -> list:
+        """
+        Pop all pending spread records from the buffer.
+
+        Returns:
+            List of spread record tuples (oldest first)
+        """
+        data_batch = []
+        while True:
+            try:
+                data_batch.append(self.spread_buffer.popleft())
+            except IndexError:
+                break
+        return data_batch
 
     def _csv_writer_loop(self):
         """
-        Background thread - periodically flushes queued data to CSV.
+        Background thread - flushes buffered data to CSV.
 
-        Runs in separate thread to avoid blocking main trading loop.
+        Wakes when a full batch is buffered (or at least once per second)
+        so the main trading loop never blocks on file I/O.
         """
         self.logger.info("Spread CSV writer thread started")
 
         while self.running:
             try:
-                # Collect queued data
-                data_batch = []
-
-                # Non-blocking drain of queue
-                while not self.spread_queue.empty():
-                    try:
-                        data_batch.append(self.spread_queue.get_nowait())
-                    except queue.Empty:
-                        break
+                # Wait for a full batch or the 1s timeout
+                self.writer_event.wait(timeout=1)
+                self.writer_event.clear()
 
                 # Write batch to CSV
+                data_batch = self._drain_buffer()
                 if data_batch:
                     self._write_batch_to_csv(data_batch)
 
-                # Sleep before next check
-                time.sleep(1)
-
             except Exception as e:
                 self.logger.error(f"Error in spread writer thread: {e}", exc_info=True)
                 time.sleep(5)  # Back off on error
 
         self.logger.info("Spread CSV writer thread stopped")
 
+    @classmethod
+    def _format_row(cls, record: tuple) -> str:
+        """Format one spread record tuple as a CSV line."""
+        return cls._CSV_ROW_TEMPLATE.format(*record)
+
     def _write_batch_to_csv(self, data_batch: list):
         """
         Write batch of spread data to CSV.
 
         Args:
-            data_batch: List of spread data dictionaries
+            data_batch: List of spread record tuples
         """
         try:
+            # Fields are known-safe (no quoting needed) - format rows directly
+            # and write the whole batch at once
+            rows = ''.join(map(self._format_row, data_batch))
             with open(self.csv_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                for data in data_batch:
-                    writer.writerow([
-                        data['timestamp'],
-                        f"{data['bid']:.2f}",
-                        f"{data['ask']:.2f}",
-                        f"{data['spread']:.2f}",
-                        data['market_open'],
-                        data['notes']
-                    ])
+                f.write(rows)
 
             self.logger.debug(f"Wrote {len(data_batch)} spread records to CSV")
 
@@ -234,17 +293,13 @@ class SpreadMonitor:
 
         self.logger.info("Stopping spread monitor...")
         self.running = False
+        self.writer_event.set()
 
         if self.writer_thread:
             self.writer_thread.join(timeout=5)
 
-        # Flush remaining queued data
-        remaining_data = []
-        while not self.spread_queue.empty():
-            try:
-                remaining_data.append(self.spread_queue.get_nowait())
-            except queue.Empty:
-                break
+        # Flush remaining buffered data
+        remaining_data = self._drain_buffer()
 
         if remaining_data:
             self._write_batch_to_csv(remaining_data)
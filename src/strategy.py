@@ -2,13 +2,27 @@
 
 import logging
 import pandas as pd
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+from .candle_buffer import CandleBuffer
 from .indicators import compute_rsi
 from .session_clock import SessionClock
 
 
+@dataclass(slots=True, frozen=True)
+class Position:
+    """Open long position (plain attributes for cheap per-tick reads)."""
+
+    entry_price: float
+    entry_time: datetime
+    tp_pts: float
+    sl_pts: float
+    tp_level: float
+    sl_level: float
+
+
 class RSI2Strategy:
     """RSI-2 rebound strategy implementation."""
 
@@ -27,11 +41,11 @@ class RSI2Strategy:
         self.rsi_period = config.get('rsi_period', 2)
         self.oversold = config.get('oversold', 3.0)
 
-        # State
-        self.candles = []
+        # State (columnar candle history)
+        self.candles = CandleBuffer()
         self.rsi_values = []
         self.seen_oversold = False
-        self.current_position: Optional[Dict[str, Any]] = None
+        self.current_position: Optional[Position] = None
 
     def add_candle(self, candle: Dict[str, Any]):
         """
@@ -43,8 +57,7 @@ class RSI2Strategy:
         self.candles.append(candle)
 
         # Keep only necessary history (RSI period + some buffer)
-        if len(self.candles) > self.rsi_period + 50:
-            self.candles = self.candles[-(self.rsi_period + 50):]
+        self.candles.trim(self.rsi_period + 50)
 
     def load_historical_candles(self, candles: List[Dict[str, Any]]):
         """
@@ -59,10 +72,11 @@ class RSI2Strategy:
             return
 
         # Clear existing candles and load historical data
-        self.candles = candles.copy()
+        self.candles.clear()
+        self.candles.extend(candles)
 
         self.logger.info(f"Loaded {len(self.candles)} historical candles")
-        self.logger.debug(f"Historical range: {self.candles[0]['timestamp']} to {self.candles[-1]['timestamp']}")
+        self.logger.debug(f"Historical range: {self.candles.timestamp_at(0)} to {self.candles.timestamp_at(-1)}")
 
         # Compute indicators immediately
         self.compute_indicators()
@@ -80,8 +94,8 @@ class RSI2Strategy:
         if len(self.candles) < self.rsi_period + 1:
             return
 
-        # Extract close prices
-        closes = pd.Series([c['close'] for c in self.candles])
+        # Close prices (column view, no per-candle dict lookups)
+        closes = pd.Series(self.candles.close)
 
         # Compute RSI
         rsi = compute_rsi(closes, self.rsi_period)
@@ -167,18 +181,18 @@ class RSI2Strategy:
             sl_pts: Stop loss in points
             timestamp: Entry timestamp
         """
-        self.current_position = {
-            'entry_price': entry_price,
-            'entry_time': timestamp,
-            'tp_pts': tp_pts,
-            'sl_pts': sl_pts,
-            'tp_level': entry_price + tp_pts,
-            'sl_level': entry_price - sl_pts
-        }
+        self.current_position = Position(
+            entry_price=entry_price,
+            entry_time=timestamp,
+            tp_pts=tp_pts,
+            sl_pts=sl_pts,
+            tp_level=entry_price + tp_pts,
+            sl_level=entry_price - sl_pts
+        )
 
         self.logger.info(f"Position opened at {entry_price:.2f} "
-                        f"(TP: {self.current_position['tp_level']:.2f}, "
-                        f"SL: {self.current_position['sl_level']:.2f})")
+                        f"(TP: {self.current_position.tp_level:.2f}, "
+                        f"SL: {self.current_position.sl_level:.2f})")
 
     def close_position(self, exit_price: float, exit_reason: str, timestamp: datetime) -> Dict[str, Any]:
         """
@@ -195,17 +209,17 @@ class RSI2Strategy:
         if self.current_position is None:
             raise ValueError("No position to close")
 
-        pnl_pts = exit_price - self.current_position['entry_price']
+        pnl_pts = exit_price - self.current_position.entry_price
         pnl_gbp = pnl_pts * self.config.get('size_gbp_per_point', 1.0)
 
         trade = {
-            'entry_time': self.current_position['entry_time'],
-            'entry_price': self.current_position['entry_price'],
+            'entry_time': self.current_position.entry_time,
+            'entry_price': self.current_position.entry_price,
             'exit_time': timestamp,
             'exit_price': exit_price,
             'exit_reason': exit_reason,
-            'tp_pts': self.current_position['tp_pts'],
-            'sl_pts': self.current_position['sl_pts'],
+            'tp_pts': self.current_position.tp_pts,
+            'sl_pts': self.current_position.sl_pts,
             'pnl_pts': pnl_pts,
             'pnl_gbp': pnl_gbp
         }
@@ -220,7 +234,7 @@ class RSI2Strategy:
         """Check if position is open."""
         return self.current_position is not None
 
-    def get_position(self) -> Optional[Dict[str, Any]]:
+    def get_position(self) -> Optional[Position]:
         """Get current position."""
         return self.current_position
 
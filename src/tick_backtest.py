@@ -1,10 +1,10 @@
 """Run tick-level backtest using tick data for realistic simulation."""
 
 import argparse
-import yaml
 from pathlib import Path
 import logging
 
+from .utils import load_config as load_config_file
 from .tick_backtest_engine import TickBacktestEngine
 from .bt_reports import BacktestReporter
 
@@ -29,8 +29,7 @@ def load_config(config_path: str, market: str = None) -> dict:
     Returns:
         Configuration dictionary
     """
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config_file(config_path)
 
     # Merge market-specific config if specified
     if market:
@@ -60,8 +59,9 @@ def parse_args():
     parser.add_argument(
         '--tp',
         type=float,
+        nargs='+',
         required=True,
-        help='Take profit in points (e.g., 40)'
+        help='Take profit in points (e.g., 40); several values run in parallel (e.g., 30 40 50)'
     )
 
     parser.add_argument(
@@ -85,6 +85,19 @@ def parse_args():
         help='Output directory for reports (default: reports/tick_backtest)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Processes to split trading days (or several --tp runs) across (default: 1)'
+    )
+
+    parser.add_argument(
+        '--no-tick-cache',
+        action='store_true',
+        help='Always parse the tick CSV (skip the <tick-data>.parquet cache)'
+    )
+
     parser.add_argument(
         '--log-level',
         type=str,
@@ -109,7 +122,7 @@ def main():
     logger.info("=" * 70)
     logger.info(f"Tick Data: {args.tick_data}")
     logger.info(f"Market: {args.market}")
-    logger.info(f"TP: {args.tp} pts")
+    logger.info(f"TP: {', '.join(f'{tp:g}' for tp in args.tp)} pts")
     logger.info("=" * 70)
 
     # Load configuration
@@ -120,7 +133,7 @@ def main():
 
     # Load tick data
     logger.info("Loading tick data...")
-    ticks_df = engine.load_tick_data(args.tick_data)
+    ticks_df = engine.load_tick_data(args.tick_data, use_cache=not args.no_tick_cache)
 
     # Build candles from ticks
     logger.info("Building candles from ticks...")
@@ -133,7 +146,11 @@ def main():
 
     # Run tick backtest
     logger.info("Running tick-level backtest...")
-    trades = engine.run_tick_backtest(ticks_df, candles_df, args.tp)
+    if len(args.tp) == 1:
+        results = [engine.run_tick_backtest(ticks_df, candles_df, args.tp[0], workers=args.workers)]
+    else:
+        results = engine.run_many(ticks_df, candles_df, [{'tp_pts': tp} for tp in args.tp],
+                                  workers=args.workers)
 
     # Generate reports
     logger.info("Generating reports...")
@@ -141,7 +158,8 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     reporter = BacktestReporter(output_dir)
-    reporter.generate_reports(trades, args.tp)
+    for tp, trades in zip(args.tp, results):
+        reporter.generate_reports(trades, tp)
 
     logger.info("=" * 70)
     logger.info("TICK BACKTEST COMPLETE")
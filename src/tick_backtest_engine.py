@@ -3,16 +3,66 @@
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 import pytz
 from datetime import datetime, timedelta
 import logging
-
-from .indicators import compute_rsi
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional - fall back to pandas' C parser
+    pa = None
+
+from .indicators import compute_rsi, compute_entry_masks
 from .session_clock import SessionClock
+from .tick_kernels import scan_ticks_long, EXIT_NONE, EXIT_REASONS
 from .trailing_stop_manager import TrailingStopManager
 
 
+# Parquet schema metadata key holding the source CSV's "<size>:<mtime_ns>"
+_TICK_CACHE_SOURCE_KEY = b'tick_csv_source'
+
+# Tick data attached by each run_many worker process (set in _init_grid_worker)
+_worker_shm = None
+_worker_ticks = None
+_worker_candles = None
+
+
+def _init_grid_worker(shm_name: str, n_ticks: int, tz: str, candles_df: pd.DataFrame):
+    """
+    Attach the parent's shared tick arrays once per worker process.
+
+    Args:
+        shm_name: SharedMemory block holding timestamps (int64 ns), bids, asks
+        n_ticks: Number of ticks
+        tz: Timezone of the tick timestamps
+        candles_df: Session candles (pickled once per worker, not per task)
+    """
+    global _worker_shm, _worker_ticks, _worker_candles
+
+    _worker_shm = SharedMemory(name=shm_name)
+    buf = _worker_shm.buf
+    tick_ns = np.ndarray(n_ticks, dtype=np.int64, buffer=buf)
+    bids = np.ndarray(n_ticks, dtype=np.float64, buffer=buf, offset=n_ticks * 8)
+    asks = np.ndarray(n_ticks, dtype=np.float64, buffer=buf, offset=n_ticks * 16)
+
+    index = pd.DatetimeIndex(tick_ns.view('M8[ns]')).tz_localize('UTC').tz_convert(tz)
+    index.name = 'timestamp'
+    _worker_ticks = pd.DataFrame({'bid': bids, 'ask': asks}, index=index, copy=False)
+    _worker_candles = candles_df
+
+
+def _run_grid_task(config: Dict[str, Any], tp_pts: float) -> List[Dict[str, Any]]:
+    """Run one parameter set against the worker's shared tick data."""
+    engine = TickBacktestEngine(config)
+    return engine.run_tick_backtest(_worker_ticks, _worker_candles.copy(deep=False), tp_pts)
+
+
 class TickBacktestEngine:
     """
     Tick-level backtesting engine for RSI-2 strategy.
@@ -43,6 +93,8 @@ class TickBacktestEngine:
         # Trailing stop configuration
         self.use_trailing_stop = config.get('use_trailing_stop', False)
         self.trailing_manager = TrailingStopManager(config) if self.use_trailing_stop else None
+        self.trailing_activation_pts = config.get('trailing_stop_activation_pts', 25)
+        self.trailing_distance_pts = config.get('trailing_stop_distance_pts', 10)
 
         # EOD exit policy
         self.force_eod_exit = config.get('force_eod_exit', True)
@@ -51,36 +103,114 @@ class TickBacktestEngine:
         # Overnight funding configuration
         self.overnight_funding_rate = config.get('overnight_funding_rate_pct', 0.035)
 
-    def load_tick_data(self, tick_data_path: str) -> pd.DataFrame:
+        # Tick bids for the SL/TP scan: float32 halves memory traffic but rounds
+        # prices (~1e-3 pts), so it is opt-in. Only the scan sees float32 bids
+        # (trailing SL levels follow its rounded highs); entry/EOD fills and P&L
+        # use float64 prices
+        self.tick_scan_dtype = np.float32 if config.get('tick_scan_float32', False) else np.float64
+
+    def load_tick_data(self, tick_data_path: str, use_cache: bool = True) -> pd.DataFrame:
         """
         Load tick data from CSV file.
 
+        The parsed ticks are cached as Parquet next to the CSV (<name>.parquet)
+        and reused while the CSV's size and mtime match the ones recorded in
+        the cache (requires pyarrow).
+
         Args:
             tick_data_path: Path to tick CSV file
+            use_cache: Read/write the Parquet tick cache
 
         Returns:
             DataFrame with columns: timestamp, bid, ask
         """
         self.logger.info(f"Loading tick data from {tick_data_path}...")
 
-        df = pd.read_csv(tick_data_path)
+        csv_path = Path(tick_data_path)
+        cache_path = csv_path.with_suffix('.parquet')
+        use_cache = use_cache and pa is not None
+
+        # Exact source identity (not "cache is newer"): a CSV replaced by an older
+        # file (cp -p, rsync -t, untar) must not reuse the cache
+        csv_stat = csv_path.stat()
+        source_key = f"{csv_stat.st_size}:{csv_stat.st_mtime_ns}".encode()
+
+        df = self._read_tick_cache(cache_path, source_key) if use_cache else None
+        if df is None:
+            df = self._read_tick_csv(csv_path)
+            if use_cache:
+                self._write_tick_cache(df, cache_path, source_key)
+
+        self.logger.info(f"Loaded {len(df):,} ticks from {df['timestamp'].min()} to {df['timestamp'].max()}")
+
+        return df
+
+    def _read_tick_csv(self, csv_path: Path) -> pd.DataFrame:
+        """
+        Parse tick CSV (ts, bid, ask columns) into a sorted DataFrame.
+
+        Args:
+            csv_path: Path to tick CSV file
+
+        Returns:
+            DataFrame with columns: timestamp, bid, ask
+        """
+        if pa is not None:
+            # Multi-threaded Arrow reader. Timestamps stay strings: Arrow rejects
+            # offset-less ISO values for a tz-aware type, pandas treats them as UTC
+            convert_options = pa_csv.ConvertOptions(column_types={
+                'ts': pa.string(),
+                'bid': pa.float64(),
+                'ask': pa.float64(),
+            })
+            df = pa_csv.read_csv(csv_path, convert_options=convert_options).to_pandas()
+        else:
+            df = pd.read_csv(csv_path, usecols=lambda col: col.lower() in ('ts', 'bid', 'ask'))
 
         # Normalize column names
         df.columns = df.columns.str.lower()
 
-        # Parse timestamp (format varies: with/without microseconds)
-        df['timestamp'] = pd.to_datetime(df['ts'], format='ISO8601', utc=True)
+        # Parse timestamp (format varies: with/without microseconds/offset; naive = UTC)
+        timestamps = pd.to_datetime(df['ts'], format='ISO8601', utc=True)
 
         # Keep only necessary columns
-        df = df[['timestamp', 'bid', 'ask']].copy()
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'bid': df['bid'].to_numpy(np.float64),
+            'ask': df['ask'].to_numpy(np.float64),
+        })
 
-        # Sort by timestamp
-        df = df.sort_values('timestamp').reset_index(drop=True)
+        # Sort by timestamp (tick exports are normally already in order)
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp', kind='stable').reset_index(drop=True)
 
-        self.logger.info(f"Loaded {len(df):,} ticks from {df['timestamp'].min()} to {df['timestamp'].max()}")
+        return df
 
+    def _read_tick_cache(self, cache_path: Path, source_key: bytes) -> Optional[pd.DataFrame]:
+        """Read Parquet tick cache if it exists and was built from this exact CSV (else None)."""
+        try:
+            metadata = pq.read_schema(cache_path).metadata or {}
+            if metadata.get(_TICK_CACHE_SOURCE_KEY) != source_key:
+                return None
+            df = pq.read_table(cache_path, columns=['timestamp', 'bid', 'ask']).to_pandas()
+        except Exception:
+            return None  # Missing, stale or corrupt cache - fall back to CSV
+
+        self.logger.info(f"Using tick cache {cache_path}")
         return df
 
+    def _write_tick_cache(self, df: pd.DataFrame, cache_path: Path, source_key: bytes):
+        """Write Parquet tick cache tagged with the source CSV key (atomic: temp file, then rename)."""
+        temp_file = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                                   _TICK_CACHE_SOURCE_KEY: source_key})
+            pq.write_table(table, temp_file, compression='zstd')
+            temp_file.replace(cache_path)
+        except Exception as e:
+            self.logger.warning(f"Could not write tick cache {cache_path}: {e}")
+
     def build_candles_from_ticks(self, ticks_df: pd.DataFrame, timeframe_minutes: int = 30) -> pd.DataFrame:
         """
         Build OHLC candles from tick data.
@@ -94,21 +224,37 @@ class TickBacktestEngine:
         """
         self.logger.info(f"Building {timeframe_minutes}-minute candles from ticks...")
 
-        # Use mid price for OHLC (bid+ask)/2
-        ticks_df['mid'] = (ticks_df['bid'] + ticks_df['ask']) / 2
-
-        # Set timestamp as index for resampling
-        ticks_df.set_index('timestamp', inplace=True)
-
-        # Resample to timeframe
-        rule = f'{timeframe_minutes}min'
-        candles = ticks_df['mid'].resample(rule).ohlc()
-
-        # Reset index to get timestamp as column
-        candles.reset_index(inplace=True)
-
-        # Drop empty candles (no ticks)
-        candles = candles.dropna()
+        timestamps = ticks_df['timestamp'] if 'timestamp' in ticks_df.columns else ticks_df.index
+        tick_ns = pd.DatetimeIndex(timestamps).as_unit('ns').asi8
+
+        # Use mid price for OHLC (bid+ask)/2 (ticks without a price are skipped)
+        mid = (ticks_df['bid'].to_numpy(np.float64) + ticks_df['ask'].to_numpy(np.float64)) * 0.5
+        has_price = ~np.isnan(mid)
+        mid = mid[has_price]
+        tick_ns = tick_ns[has_price]
+
+        if len(mid) == 0:
+            candles = pd.DataFrame({'timestamp': pd.DatetimeIndex([], tz='UTC'),
+                                    'open': [], 'high': [], 'low': [], 'close': []})
+        else:
+            # Integer bin id per tick (bins aligned to midnight of first tick's day,
+            # like resample's default origin); ticks are sorted so bins are contiguous
+            step_ns = timeframe_minutes * 60 * 1_000_000_000
+            day_ns = 24 * 60 * 60 * 1_000_000_000
+            origin_ns = tick_ns[0] - tick_ns[0] % day_ns
+            bins = (tick_ns - origin_ns) // step_ns
+
+            # Start index of each non-empty bin (empty bins never appear)
+            starts = np.flatnonzero(np.diff(bins, prepend=bins[0] - 1))
+            ends = np.append(starts[1:], len(mid)) - 1
+
+            candles = pd.DataFrame({
+                'timestamp': pd.to_datetime(origin_ns + bins[starts] * step_ns, utc=True),
+                'open': mid[starts],
+                'high': np.maximum.reduceat(mid, starts),
+                'low': np.minimum.reduceat(mid, starts),
+                'close': mid[ends],
+            })
 
         self.logger.info(f"Built {len(candles):,} candles")
 
@@ -124,48 +270,106 @@ class TickBacktestEngine:
         Returns:
             Filtered DataFrame
         """
-        mask = df['timestamp'].apply(lambda ts: self.session_clock.is_session_open(ts))
-        filtered = df[mask].copy()
-
-        # Add entry_allowed flag (skip first N minutes)
-        filtered['entry_allowed'] = filtered['timestamp'].apply(
-            lambda ts: self.session_clock.is_entry_allowed(ts)
-        )
+        # Vectorized session mask + entry_allowed flag (skip first N minutes)
+        filtered = self.session_clock.filter_dataframe(df)
 
         self.logger.info(f"Filtered to {len(filtered)} bars within session hours")
 
         return filtered
 
-    def get_ticks_for_bar(self, ticks_df: pd.DataFrame, bar_start: datetime,
-                          bar_duration_minutes: int = 30) -> pd.DataFrame:
+    def _precompute_bar_features(self, candles_df: pd.DataFrame,
+                                 bar_duration_minutes: int = 30) -> Tuple[list, list]:
         """
-        Extract ticks that fall within a specific bar's timeframe.
+        Vectorized per-bar session features (replaces per-bar SessionClock calls).
 
         Args:
-            ticks_df: Full tick DataFrame (with timestamp as index)
-            bar_start: Bar start timestamp
+            candles_df: Candles with 'timestamp' column
             bar_duration_minutes: Bar duration in minutes
 
         Returns:
-            Ticks within the bar period
+            Tuple of (trading_days, is_eod) lists where
+            trading_days are session-local dates as days since epoch and
+            is_eod matches SessionClock.is_eod_bar
         """
-        bar_end = bar_start + timedelta(minutes=bar_duration_minutes)
+        trading_days = self.session_clock.compute_trading_days(candles_df['timestamp'])
+        is_eod = self.session_clock.compute_eod_mask(candles_df['timestamp'], bar_duration_minutes)
 
-        # Filter ticks within this bar
-        mask = (ticks_df.index >= bar_start) & (ticks_df.index < bar_end)
-        bar_ticks = ticks_df[mask].copy()
+        return trading_days.tolist(), is_eod.tolist()
 
-        return bar_ticks
+    @staticmethod
+    def _bar_tick_bounds(tick_times: pd.DatetimeIndex, bar_starts: pd.Series,
+                         bar_duration_minutes: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locate every bar's tick window with one vectorized binary search.
+
+        Args:
+            tick_times: Sorted tick timestamps
+            bar_starts: Bar start timestamps
+            bar_duration_minutes: Bar duration in minutes
+
+        Returns:
+            Tuple of (first_tick, end_tick) index arrays; bar i owns ticks [first_tick[i], end_tick[i])
+        """
+        tick_ns = tick_times.as_unit('ns').asi8
+        bar_start_ns = pd.DatetimeIndex(bar_starts).as_unit('ns').asi8
+        bar_end_ns = bar_start_ns + bar_duration_minutes * 60 * 1_000_000_000
+
+        return (np.searchsorted(tick_ns, bar_start_ns, side='left'),
+                np.searchsorted(tick_ns, bar_end_ns, side='left'))
+
+    def _scan_bar_ticks(self, entry_price: float, sl_level: float, tp_level: float,
+                        tick_bids: np.ndarray, tick_times: pd.DatetimeIndex, first_tick: int,
+                        end_tick: int, bar_timestamp: datetime
+                        ) -> Tuple[Optional[float], Optional[str], datetime, float]:
+        """
+        Run the compiled tick scan over one bar and sync trailing stop state.
+
+        Args:
+            entry_price: Position entry price
+            sl_level: Current stop loss level
+            tp_level: Take profit level
+            tick_bids: All tick bid prices
+            tick_times: All tick timestamps
+            first_tick: First tick index of the bar
+            end_tick: One past the last tick index of the bar
+            bar_timestamp: Bar start (exit time if no tick exit)
+
+        Returns:
+            Tuple of (exit_price, exit_reason, exit_time, sl_level); price/reason None
+            if no exit, sl_level is the (possibly trailed) stop after the scan
+        """
+        trailing = self.trailing_manager
+        if trailing:
+            highest_bid, trailing_active = trailing.highest_bid, trailing.trailing_active
+        else:
+            highest_bid, trailing_active = entry_price, False
+
+        exit_index, exit_price, exit_code, highest_bid, sl_level, trailing_active = scan_ticks_long(
+            tick_bids[first_tick:end_tick], sl_level, tp_level,
+            entry_price, highest_bid, trailing_active, trailing is not None,
+            self.trailing_activation_pts, self.trailing_distance_pts
+        )
+        # Upcast (bids may be float32) so levels and P&L stay float64
+        highest_bid, sl_level, exit_price = float(highest_bid), float(sl_level), float(exit_price)
 
-    def _calculate_overnight_charge(self, entry_price: float, days_held: int) -> float:
-        """Calculate overnight funding charge."""
-        if days_held == 0:
-            return 0.0
+        if trailing:
+            trailing.highest_bid = highest_bid
+            trailing.trailing_active = trailing_active
+            trailing.current_sl_level = sl_level
+
+        if exit_code == EXIT_NONE:
+            return None, None, bar_timestamp, sl_level
+        return exit_price, EXIT_REASONS[exit_code], tick_times[first_tick + exit_index], sl_level
+
+    def _calculate_overnight_charge(self, entry_price: Union[float, np.ndarray],
+                                    days_held: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+        """Calculate overnight funding charge (scalars or per-trade arrays)."""
         daily_rate = self.overnight_funding_rate / 365.0
         charge_pts = entry_price * daily_rate * days_held
         return charge_pts
 
-    def run_tick_backtest(self, ticks_df: pd.DataFrame, candles_df: pd.DataFrame, tp_pts: float) -> List[Dict[str, Any]]:
+    def run_tick_backtest(self, ticks_df: pd.DataFrame, candles_df: pd.DataFrame, tp_pts: float,
+                          workers: int = 1) -> List[Dict[str, Any]]:
         """
         Run backtest using tick data for exit logic.
 
@@ -177,6 +381,8 @@ class TickBacktestEngine:
             ticks_df: Tick-level data
             candles_df: Pre-built candles (for RSI and entry signals)
             tp_pts: Take profit in points
+            workers: Number of processes to split trading days across
+                     (only used with force_eod_exit, where days are independent)
 
         Returns:
             List of trade dictionaries
@@ -189,181 +395,310 @@ class TickBacktestEngine:
         if 'timestamp' in ticks_df.columns:
             ticks_df = ticks_df.set_index('timestamp')
 
-        # Compute RSI on candles
+        # Compute RSI on candles (once, over the full history)
         candles_df['rsi'] = compute_rsi(candles_df['close'], self.rsi_period)
 
-        trades = []
-        position = None
+        if workers > 1 and self.force_eod_exit:
+            trades = self._run_days_parallel(ticks_df, candles_df, tp_pts, workers)
+        else:
+            trades, _ = self._simulate(ticks_df, candles_df, tp_pts)
+
+        self.logger.info("=" * 60)
+        self.logger.info(f"Tick backtest complete: {len(trades)} trades")
+        self.logger.info("=" * 60)
+
+        return trades
+
+    def run_many(self, ticks_df: pd.DataFrame, candles_df: pd.DataFrame,
+                 param_sets: List[Dict[str, Any]], workers: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Run independent backtests for several parameter sets in parallel.
+
+        Tick timestamps/bids/asks are placed in one SharedMemory block that
+        every worker attaches to, so the tick DataFrame is never pickled.
+
+        Args:
+            ticks_df: Tick-level data
+            candles_df: Session candles (from filter_session_bars)
+            param_sets: One dict per run with 'tp_pts' plus any config overrides
+                        (e.g. {'tp_pts': 40, 'oversold': 5, 'stop_loss_pts': 30})
+            workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            List of trade lists, in the same order as param_sets
+        """
+        if 'timestamp' in ticks_df.columns:
+            ticks_df = ticks_df.set_index('timestamp')
+
+        workers = min(workers or os.cpu_count() or 1, len(param_sets)) or 1
+        n_ticks = len(ticks_df)
+        tick_times = pd.DatetimeIndex(ticks_df.index)
+
+        shm = SharedMemory(create=True, size=max(n_ticks * 24, 1))
+        try:
+            np.ndarray(n_ticks, dtype=np.int64, buffer=shm.buf)[:] = tick_times.as_unit('ns').asi8
+            np.ndarray(n_ticks, dtype=np.float64, buffer=shm.buf, offset=n_ticks * 8)[:] = ticks_df['bid'].to_numpy(np.float64)
+            np.ndarray(n_ticks, dtype=np.float64, buffer=shm.buf, offset=n_ticks * 16)[:] = ticks_df['ask'].to_numpy(np.float64)
+
+            self.logger.info(f"Running {len(param_sets)} parameter sets across {workers} processes")
+
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_grid_worker,
+                                     initargs=(shm.name, n_ticks, str(tick_times.tz or 'UTC'), candles_df)) as pool:
+                futures = []
+                for params in param_sets:
+                    overrides = {key: value for key, value in params.items() if key != 'tp_pts'}
+                    futures.append(pool.submit(_run_grid_task, {**self.config, **overrides}, params['tp_pts']))
+                return [future.result() for future in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _run_days_parallel(self, ticks_df: pd.DataFrame, candles_df: pd.DataFrame, tp_pts: float,
+                           workers: int) -> List[Dict[str, Any]]:
+        """
+        Simulate blocks of consecutive trading days in separate processes.
+
+        With force_eod_exit every position is flat by the session's EOD bar and
+        daily state is reset, so trading days are independent. If a block still
+        ends with an open position (e.g. EOD bar missing from data), falls back
+        to the sequential run so results stay identical.
+
+        Args:
+            ticks_df: Tick data indexed by timestamp
+            candles_df: Session candles with 'rsi' column
+            tp_pts: Take profit in points
+            workers: Number of worker processes
+
+        Returns:
+            List of trade dictionaries
+        """
+        trading_dates = self.session_clock.compute_trading_days(candles_df['timestamp'])
+        day_blocks = [block for block in np.array_split(pd.unique(trading_dates), workers) if len(block)]
+
+        jobs = []
+        for block in day_blocks:
+            block_candles = candles_df[np.isin(trading_dates, block)]
+            start = block_candles['timestamp'].iloc[0]
+            end = block_candles['timestamp'].iloc[-1] + timedelta(minutes=30)
+            block_ticks = ticks_df.iloc[ticks_df.index.searchsorted(start):ticks_df.index.searchsorted(end)]
+            jobs.append((block_ticks, block_candles))
+
+        self.logger.info(f"Running {len(jobs)} day blocks across {workers} processes")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._simulate, block_ticks, block_candles, tp_pts)
+                       for block_ticks, block_candles in jobs]
+            results = [future.result() for future in futures]
+
+        if any(open_at_end for _, open_at_end in results[:-1]):
+            self.logger.warning("Position spans day blocks - rerunning sequentially")
+            trades, _ = self._simulate(ticks_df, candles_df, tp_pts)
+            return trades
+
+        return [trade for block_trades, _ in results for trade in block_trades]
+
+    def _simulate(self, ticks_df: pd.DataFrame, candles_df: pd.DataFrame,
+                  tp_pts: float) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Sequential candle/tick simulation loop.
+
+        Args:
+            ticks_df: Tick data indexed by timestamp
+            candles_df: Session candles with 'rsi' column
+            tp_pts: Take profit in points
+
+        Returns:
+            Tuple of (trades, position_open_at_end)
+        """
+        # Open position state as plain locals (no per-bar dict lookups)
+        in_position = False
+        entry_bar = entry_day = -1
+        entry_price = tp_level = sl_level = 0.0
+        bars_held = days_held = 0
         seen_oversold = False
         entry_signal = False
         current_date = None
 
+        # Sorted tick columns, sliced per bar with precomputed [first, end) indices
+        tick_times = ticks_df.index
+        tick_bids = ticks_df['bid'].to_numpy(np.float64)  # Exit pricing (always float64)
+        tick_asks = ticks_df['ask'].to_numpy(np.float64)
+        scan_bids = np.ascontiguousarray(tick_bids, dtype=self.tick_scan_dtype)  # Kernel input only
+        bar_first_ticks, bar_end_ticks = self._bar_tick_bounds(tick_times, candles_df['timestamp'], 30)
+
+        # Candle columns as plain lists (no per-row Series construction)
+        bar_timestamps = candles_df['timestamp'].tolist()
+        bar_opens = candles_df['open'].tolist()
+        bar_closes = candles_df['close'].tolist()
+        bar_trading_days, bar_is_eod = self._precompute_bar_features(candles_df, 30)
+
+        # Per-bar entry conditions computed up front; the loop only runs the
+        # stateful part (seen_oversold/entry_signal are gated by open position)
+        bar_has_rsi, bar_oversold, bar_rebound = compute_entry_masks(
+            candles_df['rsi'], self.oversold, candles_df['entry_allowed']
+        )
+
+        # Closed trades written by index into preallocated columns. A trade needs a
+        # signal bar plus at least one bar in position, so n_bars // 2 + 1 is an upper bound
+        capacity = len(bar_timestamps) // 2 + 1
+        trade_entry_bar = np.empty(capacity, dtype=np.int64)
+        trade_entry_price = np.empty(capacity, dtype=np.float64)
+        trade_exit_price = np.empty(capacity, dtype=np.float64)
+        trade_exit_reason = np.empty(capacity, dtype=object)
+        trade_exit_ns = np.empty(capacity, dtype=np.int64)
+        trade_days_held = np.empty(capacity, dtype=np.int64)
+        trade_bars_held = np.empty(capacity, dtype=np.int64)
+        n_trades = 0
+
         # Process each candle for entry signals
-        for idx, row in candles_df.iterrows():
-            bar_timestamp = row['timestamp']
-            bar_date = self.session_clock.get_trading_date(bar_timestamp)
+        for bar_i in range(len(bar_timestamps)):
+            bar_timestamp = bar_timestamps[bar_i]
+            bar_date = bar_trading_days[bar_i]
 
             # Reset state at start of new trading day
             if current_date is None or bar_date != current_date:
                 current_date = bar_date
-                if position is None:
+                if not in_position:
                     seen_oversold = False
                     entry_signal = False
 
             # Skip if RSI not available
-            if pd.isna(row['rsi']):
+            if not bar_has_rsi[bar_i]:
                 continue
 
             # === ENTRY LOGIC (on candle close) ===
-            if row['rsi'] <= self.oversold:
+            if bar_oversold[bar_i]:
                 seen_oversold = True
 
-            if (position is None and
+            if (not in_position and
                 not entry_signal and
                 seen_oversold and
-                row['rsi'] > self.oversold and
-                row['entry_allowed']):
+                bar_rebound[bar_i]):
 
                 entry_signal = True
                 seen_oversold = False
 
             # Execute entry on NEXT bar
-            elif entry_signal and position is None:
-                # Get ticks for this bar (entry happens at first tick)
-                bar_ticks = self.get_ticks_for_bar(ticks_df, bar_timestamp, 30)
+            elif entry_signal and not in_position:
+                # Ticks for this bar (entry happens at first tick)
+                first_tick = bar_first_ticks[bar_i]
+                end_tick = bar_end_ticks[bar_i]
 
-                if len(bar_ticks) == 0:
+                if first_tick == end_tick:
                     # No ticks in this bar, use bar open price
-                    entry_price = row['open']
+                    entry_price = bar_opens[bar_i]
                 else:
                     # Enter at first tick's ask price
-                    first_tick = bar_ticks.iloc[0]
-                    entry_price = first_tick['ask']
+                    entry_price = tick_asks[first_tick]
 
                 # Initialize position
-                position = {
-                    'entry_price': entry_price,
-                    'entry_time': bar_timestamp,
-                    'entry_time_local': self.session_clock.localize_timestamp(bar_timestamp),
-                    'entry_date': self.session_clock.localize_timestamp(bar_timestamp).date(),
-                    'tp_level': entry_price + tp_pts,
-                    'sl_level': entry_price - self.stop_loss_pts,
-                    'bars_held': 0,
-                    'days_held': 0,
-                    'overnight_charges_pts': 0.0,
-                }
+                in_position = True
+                entry_bar = bar_i
+                entry_day = bar_date
+                tp_level = entry_price + tp_pts
+                sl_level = entry_price - self.stop_loss_pts
+                bars_held = 0
 
                 # Initialize trailing stop manager
                 if self.trailing_manager:
                     self.trailing_manager.on_position_opened(
                         entry_price=entry_price,
-                        tp_level=position['tp_level'],
-                        sl_level=position['sl_level'],
+                        tp_level=tp_level,
+                        sl_level=sl_level,
                         deal_id='backtest'
                     )
 
-                self.logger.debug(f"ENTRY at {bar_timestamp}: {entry_price:.2f} (TP: {position['tp_level']:.2f}, SL: {position['sl_level']:.2f})")
+                # Lazy %-args: formatting is skipped unless DEBUG is enabled
+                self.logger.debug("ENTRY at %s: %.2f (TP: %.2f, SL: %.2f)",
+                                  bar_timestamp, entry_price, tp_level, sl_level)
 
                 entry_signal = False
 
             # === EXIT LOGIC (tick-by-tick within bar) ===
-            if position is not None:
-                position['bars_held'] += 1
-
-                # Track overnight charges
-                current_date_check = self.session_clock.localize_timestamp(bar_timestamp).date()
-                if current_date_check != position['entry_date']:
-                    days_diff = (current_date_check - position['entry_date']).days
-                    if days_diff > position['days_held']:
-                        nights_to_charge = days_diff - position['days_held']
-                        charge = self._calculate_overnight_charge(position['entry_price'], nights_to_charge)
-                        position['overnight_charges_pts'] += charge
-                        position['days_held'] = days_diff
-
-                # Get ticks for this bar
-                bar_ticks = self.get_ticks_for_bar(ticks_df, bar_timestamp, 30)
+            if in_position:
+                bars_held += 1
+
+                # Nights held (calendar days since entry); charges are computed at exit
+                days_held = bar_date - entry_day
+
+                # Ticks for this bar
+                first_tick = bar_first_ticks[bar_i]
+                end_tick = bar_end_ticks[bar_i]
 
                 exit_price = None
                 exit_reason = None
                 exit_time = bar_timestamp
 
                 # Check max hold days
-                if self.max_hold_days > 0 and position['days_held'] >= self.max_hold_days:
-                    exit_price = row['close']
+                if self.max_hold_days > 0 and days_held >= self.max_hold_days:
+                    exit_price = bar_closes[bar_i]
                     exit_reason = 'MAX_HOLD_DAYS'
 
                 # Process ticks within this bar
-                if exit_price is None and len(bar_ticks) > 0:
-                    for tick_time, tick in bar_ticks.iterrows():
-                        bid = tick['bid']
-
-                        # Update trailing stop (if enabled)
-                        if self.trailing_manager:
-                            should_update, new_sl, _ = self.trailing_manager.on_tick(bid)
-                            if should_update and new_sl:
-                                position['sl_level'] = new_sl
-
-                        # Check SL hit (conservative: check SL first)
-                        if bid <= position['sl_level']:
-                            exit_price = position['sl_level']
-                            exit_reason = 'TRAILING_SL' if (self.trailing_manager and self.trailing_manager.trailing_active) else 'SL'
-                            exit_time = tick_time
-                            break
-
-                        # Check TP hit
-                        if bid >= position['tp_level']:
-                            exit_price = position['tp_level']
-                            exit_reason = 'TP'
-                            exit_time = tick_time
-                            break
+                if exit_price is None and end_tick > first_tick:
+                    exit_price, exit_reason, exit_time, sl_level = self._scan_bar_ticks(
+                        entry_price, sl_level, tp_level, scan_bids, tick_times,
+                        first_tick, end_tick, exit_time
+                    )
 
                 # Check EOD exit
                 if exit_price is None and self.force_eod_exit:
-                    is_eod = self.session_clock.is_eod_bar(bar_timestamp, bar_duration_minutes=30)
-                    if is_eod:
+                    if bar_is_eod[bar_i]:
                         # Exit at last tick's bid or bar close
-                        if len(bar_ticks) > 0:
-                            exit_price = bar_ticks.iloc[-1]['bid']
+                        if end_tick > first_tick:
+                            exit_price = float(tick_bids[end_tick - 1])
                         else:
-                            exit_price = row['close']
+                            exit_price = bar_closes[bar_i]
                         exit_reason = 'EOD'
 
                 # Close position if exit triggered
                 if exit_price is not None:
-                    pnl_pts_gross = exit_price - position['entry_price']
-                    overnight_charges = position['overnight_charges_pts']
-                    pnl_pts_net = pnl_pts_gross - overnight_charges
-                    pnl_gbp = pnl_pts_net * self.size_gbp_per_point
-
-                    trade = {
-                        'datetime_open': position['entry_time'],
-                        'ny_time_open': position['entry_time_local'].strftime('%Y-%m-%d %H:%M:%S'),
-                        'entry_price': position['entry_price'],
-                        'tp_pts': tp_pts,
-                        'sl_pts': self.stop_loss_pts,
-                        'datetime_close': exit_time,
-                        'ny_time_close': self.session_clock.localize_timestamp(exit_time).strftime('%Y-%m-%d %H:%M:%S'),
-                        'exit_price': exit_price,
-                        'exit_reason': exit_reason,
-                        'pnl_pts': pnl_pts_net,
-                        'pnl_pts_gross': pnl_pts_gross,
-                        'overnight_charges': overnight_charges,
-                        'days_held': position['days_held'],
-                        'pnl_gbp': pnl_gbp,
-                        'bars_held': position['bars_held']
-                    }
-
-                    trades.append(trade)
-
-                    self.logger.debug(f"EXIT at {exit_time}: {exit_price:.2f} ({exit_reason}) | P&L: {pnl_pts_net:+.2f} pts")
+                    trade_entry_bar[n_trades] = entry_bar
+                    trade_entry_price[n_trades] = entry_price
+                    trade_exit_price[n_trades] = exit_price
+                    trade_exit_reason[n_trades] = exit_reason
+                    trade_exit_ns[n_trades] = pd.Timestamp(exit_time).value
+                    trade_days_held[n_trades] = days_held
+                    trade_bars_held[n_trades] = bars_held
+                    n_trades += 1
+
+                    self.logger.debug("EXIT at %s: %.2f (%s) | P&L: %+.2f pts gross, %d nights",
+                                      exit_time, exit_price, exit_reason, exit_price - entry_price, days_held)
 
                     # Reset position and trailing manager
-                    position = None
+                    in_position = False
                     if self.trailing_manager:
                         self.trailing_manager.on_position_closed()
 
-        self.logger.info("=" * 60)
-        self.logger.info(f"Tick backtest complete: {len(trades)} trades")
-        self.logger.info("=" * 60)
-
-        return trades
+        # Build all trade fields column-wise, then hand out plain trade dicts
+        entry_bars = trade_entry_bar[:n_trades]
+        entry_prices = trade_entry_price[:n_trades]
+        days_held = trade_days_held[:n_trades]
+        overnight = self._calculate_overnight_charge(entry_prices, days_held)
+        pnl_pts_gross = trade_exit_price[:n_trades] - entry_prices
+        pnl_pts_net = pnl_pts_gross - overnight
+
+        entry_times = candles_df['timestamp'].iloc[entry_bars].reset_index(drop=True)
+        exit_times = pd.Series(pd.to_datetime(trade_exit_ns[:n_trades], unit='ns', utc=True))
+        if entry_times.dt.tz is not None:
+            exit_times = exit_times.dt.tz_convert(entry_times.dt.tz)
+
+        trades = pd.DataFrame({
+            'datetime_open': entry_times,
+            'ny_time_open': self.session_clock.localize_series(entry_times).dt.strftime('%Y-%m-%d %H:%M:%S'),
+            'entry_price': entry_prices,
+            'tp_pts': tp_pts,
+            'sl_pts': self.stop_loss_pts,
+            'datetime_close': exit_times,
+            'ny_time_close': self.session_clock.localize_series(exit_times).dt.strftime('%Y-%m-%d %H:%M:%S'),
+            'exit_price': trade_exit_price[:n_trades],
+            'exit_reason': trade_exit_reason[:n_trades],
+            'pnl_pts': pnl_pts_net,
+            'pnl_pts_gross': pnl_pts_gross,
+            'overnight_charges': overnight,
+            'days_held': days_held,
+            'pnl_gbp': pnl_pts_net * self.size_gbp_per_point,
+            'bars_held': trade_bars_held[:n_trades],
+        }).to_dict('records')
+
+        return trades, in_position
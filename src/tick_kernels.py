@@ -0,0 +1,165 @@
+"""Tick scan kernels for the tick-level backtest (Numba-compiled when available)."""
+
+import numpy as np
+
+from .trailing_stop_manager import TrailingStopManager
+
+try:
+    from numba import njit, types
+except ImportError:  # numba is optional - fall back to plain Python
+    njit = None
+
+
+# Exit reason codes returned by the kernels
+EXIT_NONE = 0
+EXIT_SL = 1
+EXIT_TP = 2
+EXIT_TRAILING_SL = 3
+
+EXIT_REASONS = {
+    EXIT_SL: 'SL',
+    EXIT_TP: 'TP',
+    EXIT_TRAILING_SL: 'TRAILING_SL',
+}
+
+
+def _scan_ticks_long(bids, sl_level, tp_level, entry_price, highest_bid, trailing_active,
+                     use_trailing, activation_pts, distance_pts):
+    """
+    Scan bid ticks of a long position for the first SL/TP hit.
+
+    Trailing stop follows TrailingStopManager.on_tick: track highest bid,
+    activate once profit >= activation_pts, then trail SL distance_pts
+    behind the highest bid (only ever moving up). SL is checked before TP.
+
+    Args:
+        bids: Bid prices (1-D float array)
+        sl_level: Current stop loss level
+        tp_level: Take profit level
+        entry_price: Position entry price
+        highest_bid: Highest bid seen so far
+        trailing_active: Whether trailing stop is already active
+        use_trailing: Whether trailing stop is enabled
+        activation_pts: Profit needed to activate trailing
+        distance_pts: Trailing distance behind highest bid
+
+    Returns:
+        Tuple of (exit_index, exit_price, exit_code, highest_bid, sl_level, trailing_active);
+        exit_index is -1 and exit_code EXIT_NONE if no exit in these ticks
+    """
+    for i in range(len(bids)):
+        bid = bids[i]
+
+        if use_trailing:
+            # Branchless updates (select/max lower to cmov/maxsd under Numba)
+            highest_bid = bid if bid > highest_bid else highest_bid
+            trailing_active = trailing_active | (highest_bid - entry_price >= activation_pts)
+            new_sl = highest_bid - distance_pts
+            sl_level = new_sl if (trailing_active & (new_sl > sl_level)) else sl_level
+
+        # Check SL hit (conservative: check SL first)
+        if bid <= sl_level:
+            exit_code = EXIT_TRAILING_SL if trailing_active else EXIT_SL
+            return i, sl_level, exit_code, highest_bid, sl_level, trailing_active
+
+        # Check TP hit
+        if bid >= tp_level:
+            return i, tp_level, EXIT_TP, highest_bid, sl_level, trailing_active
+
+    return -1, np.nan, EXIT_NONE, highest_bid, sl_level, trailing_active
+
+
+def _scan_ticks_long_fixed(bids, sl_level, tp_level, highest_bid, trailing_active):
+    """
+    Vectorized _scan_ticks_long for a fixed (non-trailing) stop.
+
+    With no state carried tick to tick the first exit is just the first
+    crossing of either level, found with one mask and argmax instead of a
+    per-tick Python loop.
+
+    Args:
+        bids: Bid prices (1-D float array)
+        sl_level: Stop loss level
+        tp_level: Take profit level
+        highest_bid: Highest bid seen so far (passed through unchanged)
+        trailing_active: Trailing state (passed through unchanged)
+
+    Returns:
+        Same tuple as _scan_ticks_long
+    """
+    if len(bids) == 0:
+        return -1, np.nan, EXIT_NONE, highest_bid, sl_level, trailing_active
+
+    # float64 scalars so float32 bids are compared at float64, as in the kernel
+    sl_level, tp_level = np.float64(sl_level), np.float64(tp_level)
+    hits = (bids <= sl_level) | (bids >= tp_level)
+
+    # argmax stops at the first True; a False there means no hit at all
+    i = int(hits.argmax())
+    if not hits[i]:
+        return -1, np.nan, EXIT_NONE, highest_bid, sl_level, trailing_active
+
+    # Check SL first (conservative), as in the loop
+    if bids[i] <= sl_level:
+        exit_code = EXIT_TRAILING_SL if trailing_active else EXIT_SL
+        return i, sl_level, exit_code, highest_bid, sl_level, trailing_active
+    return i, tp_level, EXIT_TP, highest_bid, sl_level, trailing_active
+
+
+def _scan_ticks_long_trailing(bids, sl_level, tp_level, entry_price, highest_bid, trailing_active,
+                              activation_pts, distance_pts):
+    """
+    Vectorized _scan_ticks_long with the trailing stop enabled.
+
+    The whole trailing state path comes from TrailingStopManager.simulate_series;
+    the first exit is then the first tick at/below its SL or at/above TP.
+
+    Returns:
+        Same tuple as _scan_ticks_long
+    """
+    if len(bids) == 0:
+        return -1, np.nan, EXIT_NONE, highest_bid, sl_level, trailing_active
+
+    highest_bids, sl_levels, active = TrailingStopManager.simulate_series(
+        bids, entry_price, sl_level, activation_pts, distance_pts, highest_bid, trailing_active
+    )
+    sl_hits = bids <= sl_levels
+    hits = sl_hits | (bids >= np.float64(tp_level))
+
+    i = int(hits.argmax())  # first True, or 0 if none
+    if not hits[i]:
+        return -1, np.nan, EXIT_NONE, highest_bids[-1], sl_levels[-1], bool(active[-1])
+
+    if sl_hits[i]:
+        exit_code = EXIT_TRAILING_SL if active[i] else EXIT_SL
+        return i, sl_levels[i], exit_code, highest_bids[i], sl_levels[i], bool(active[i])
+    return i, tp_level, EXIT_TP, highest_bids[i], sl_levels[i], bool(active[i])
+
+
+def _scan_ticks_long_python(bids, sl_level, tp_level, entry_price, highest_bid, trailing_active,
+                            use_trailing, activation_pts, distance_pts):
+    """Plain-Python scan_ticks_long: NumPy passes instead of a per-tick loop."""
+    if not use_trailing:
+        return _scan_ticks_long_fixed(bids, sl_level, tp_level, highest_bid, trailing_active)
+    return _scan_ticks_long_trailing(bids, sl_level, tp_level, entry_price, highest_bid,
+                                     trailing_active, activation_pts, distance_pts)
+
+
+if njit is not None:
+    # Explicit signatures: compiled eagerly (and cached) for contiguous float64/float32
+    # bid arrays, writable or read-only (pandas copy-on-write views), so no type
+    # inference or compilation happens on the first bar
+    _scan_result = types.Tuple((types.intp, types.float64, types.intp,
+                                types.float64, types.float64, types.boolean))
+    _SCAN_TICKS_LONG_SIGNATURES = [
+        _scan_result(types.Array(dtype, 1, 'C', readonly=readonly),
+                     types.float64, types.float64, types.float64, types.float64,
+                     types.boolean, types.boolean, types.float64, types.float64)
+        for dtype in (types.float64, types.float32)
+        for readonly in (False, True)
+    ]
+    scan_ticks_long = njit(_SCAN_TICKS_LONG_SIGNATURES, cache=True)(_scan_ticks_long)
+else:
+    # The compiled loop already stops at the first hit, so the NumPy
+    # first-crossing path is only used without numba
+    scan_ticks_long = _scan_ticks_long_python
@@ -6,41 +6,55 @@ from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 
 class TradeLogger:
     """Logs trades to CSV file and console."""
 
-    def __init__(self, log_file: str = "data/trades/trades.csv"):
+    def __init__(self, log_file: str = "data/trades/trades.csv", flush_each_trade: bool = True):
         """
         Initialize trade logger.
 
         Args:
             log_file: Path to trade log CSV file
+            flush_each_trade: Flush after every trade (live durability); False
+                              leaves rows buffered until close() (backtests)
         """
         self.log_file = Path(log_file)
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_each_trade = flush_each_trade
 
         self.logger = logging.getLogger("rsi2_strategy.trade_log")
 
+        # Single append handle + writer for the logger's lifetime
+        self._open()
+
+    def _open(self):
+        """Open the append handle, writing the CSV header if the file is new."""
+        write_header = not self.log_file.exists()
+        self._file = open(self.log_file, 'a', newline='', buffering=65536)
+        self._writer = csv.writer(self._file)
+
         # Initialize CSV file with headers if it doesn't exist
-        if not self.log_file.exists():
+        if write_header:
             self._write_header()
 
     def _write_header(self):
         """Write CSV header."""
-        with open(self.log_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'entry_time',
-                'entry_price',
-                'exit_time',
-                'exit_price',
-                'exit_reason',
-                'tp_pts',
-                'sl_pts',
-                'pnl_pts',
-                'pnl_gbp'
-            ])
+        self._writer.writerow([
+            'entry_time',
+            'entry_price',
+            'exit_time',
+            'exit_price',
+            'exit_reason',
+            'tp_pts',
+            'sl_pts',
+            'pnl_pts',
+            'pnl_gbp'
+        ])
+        self._file.flush()
 
     def log_trade(self, trade: Dict[str, Any]):
         """
@@ -49,20 +63,24 @@ class TradeLogger:
         Args:
             trade: Trade dictionary
         """
+        # Reopen if already closed (e.g. a position closed during shutdown)
+        if self._file.closed:
+            self._open()
+
         # Log to CSV
-        with open(self.log_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                trade['entry_time'].isoformat(),
-                trade['entry_price'],
-                trade['exit_time'].isoformat(),
-                trade['exit_price'],
-                trade['exit_reason'],
-                trade['tp_pts'],
-                trade['sl_pts'],
-                trade['pnl_pts'],
-                trade['pnl_gbp']
-            ])
+        self._writer.writerow([
+            trade['entry_time'].isoformat(),
+            trade['entry_price'],
+            trade['exit_time'].isoformat(),
+            trade['exit_price'],
+            trade['exit_reason'],
+            trade['tp_pts'],
+            trade['sl_pts'],
+            trade['pnl_pts'],
+            trade['pnl_gbp']
+        ])
+        if self.flush_each_trade:
+            self._file.flush()
 
         # Log to console
         pnl_sign = '+' if trade['pnl_pts'] >= 0 else ''
@@ -81,7 +99,11 @@ class TradeLogger:
         Returns:
             Dictionary with summary statistics
         """
-        if not self.log_file.exists():
+        if not self._file.closed:
+            self._file.flush()
+
+        # Missing or zero-byte file (read_csv raises EmptyDataError on the latter)
+        if not self.log_file.exists() or self.log_file.stat().st_size == 0:
             return {
                 'total_trades': 0,
                 'total_pnl_pts': 0.0,
@@ -89,16 +111,11 @@ class TradeLogger:
                 'win_rate': 0.0
             }
 
-        trades = []
-        with open(self.log_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                trades.append({
-                    'pnl_pts': float(row['pnl_pts']),
-                    'pnl_gbp': float(row['pnl_gbp'])
-                })
+        # Only the P&L columns, typed up front (no per-row dicts/float parsing)
+        trades = pd.read_csv(self.log_file, usecols=['pnl_pts', 'pnl_gbp'],
+                             dtype={'pnl_pts': np.float64, 'pnl_gbp': np.float64})
 
-        if not trades:
+        if len(trades) == 0:
             return {
                 'total_trades': 0,
                 'total_pnl_pts': 0.0,
@@ -106,10 +123,11 @@ class TradeLogger:
                 'win_rate': 0.0
             }
 
-        total_trades = len(trades)
-        total_pnl_pts = sum(t['pnl_pts'] for t in trades)
-        total_pnl_gbp = sum(t['pnl_gbp'] for t in trades)
-        winning_trades = sum(1 for t in trades if t['pnl_pts'] > 0)
+        pnl_pts = trades['pnl_pts'].to_numpy()
+        total_trades = len(pnl_pts)
+        total_pnl_pts = float(pnl_pts.sum())
+        total_pnl_gbp = float(trades['pnl_gbp'].to_numpy().sum())
+        winning_trades = int((pnl_pts > 0).sum())
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
 
         return {
@@ -135,3 +153,8 @@ class TradeLogger:
         self.logger.info(f"Total P&L:        {summary['total_pnl_pts']:.2f} pts / "
                         f"{summary['total_pnl_gbp']:.2f} GBP")
         self.logger.info("=" * 60)
+
+    def close(self):
+        """Flush buffered rows and close the trade log file."""
+        if not self._file.closed:
+            self._file.close()
@@ -6,6 +6,18 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib encoder
+    orjson = None
+
+
+def _json_default(obj: Any) -> str:
+    """Encode non-JSON values (datetime/date as ISO 8601, anything else via str)."""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
 
 class TradeState:
     """
@@ -52,8 +64,13 @@ class TradeState:
         temp_file = self.state_file.with_suffix('.tmp')
 
         try:
-            with open(temp_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            # Compact encoding (machine-read only); single write with orjson
+            if orjson is not None:
+                with open(temp_file, 'wb') as f:
+                    f.write(orjson.dumps(state, default=_json_default))
+            else:
+                with open(temp_file, 'w') as f:
+                    json.dump(state, f, separators=(',', ':'), default=_json_default)
 
             # Atomic rename (prevents corruption if crash during write)
             temp_file.replace(self.state_file)
@@ -77,8 +94,12 @@ class TradeState:
             return None
 
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            if orjson is not None:
+                with open(self.state_file, 'rb') as f:
+                    state = orjson.loads(f.read())
+            else:
+                with open(self.state_file, 'r') as f:
+                    state = json.load(f)
 
             position = state.get('position')
             last_updated = state.get('last_updated')
@@ -1,8 +1,11 @@
 """Trailing stop manager for dynamic SL updates."""
 
 import logging
+import math
 from typing import Optional, Dict, Any, Tuple
 
+import numpy as np
+
 
 class TrailingStopManager:
     """
@@ -12,6 +15,11 @@ class TrailingStopManager:
     Works in conjunction with broker API to update SL levels.
     """
 
+    # Fixed attribute layout (no per-instance __dict__ on the tick path)
+    __slots__ = ('config', 'logger', 'enabled', 'activation_pts', 'distance_pts',
+                 '_entry_price', '_tp_level', '_initial_sl', '_deal_id', '_activation_bid',
+                 'highest_bid', 'trailing_active', 'current_sl_level', '_debug', '_info')
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize trailing stop manager.
@@ -27,18 +35,30 @@ class TrailingStopManager:
         self.activation_pts = config.get('trailing_stop_activation_pts', 25)
         self.distance_pts = config.get('trailing_stop_distance_pts', 10)
 
-        # Position tracking
-        self.position: Optional[Dict[str, Any]] = None
+        # Position tracking (plain scalars; _entry_price is None when flat)
+        self._entry_price: Optional[float] = None
+        self._tp_level: Optional[float] = None
+        self._initial_sl: Optional[float] = None
+        self._deal_id: Optional[str] = None
+        self._activation_bid: Optional[float] = None
         self.highest_bid: Optional[float] = None
         self.trailing_active: bool = False
         self.current_sl_level: Optional[float] = None
 
+        # Log levels cached for the tick path (refreshed per position)
+        self.refresh_log_levels()
+
         if self.enabled:
-            self.logger.info(f"Trailing stop enabled: activation={self.activation_pts} pts, "
-                           f"distance={self.distance_pts} pts")
+            self.logger.info("Trailing stop enabled: activation=%s pts, distance=%s pts",
+                             self.activation_pts, self.distance_pts)
         else:
             self.logger.info("Trailing stop disabled")
 
+    def refresh_log_levels(self):
+        """Re-read which log levels are enabled (call after reconfiguring logging)."""
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+        self._info = self.logger.isEnabledFor(logging.INFO)
+
     def is_enabled(self) -> bool:
         """Check if trailing stop is enabled."""
         return self.enabled
@@ -54,18 +74,18 @@ class TrailingStopManager:
             sl_level: Initial stop loss level
             deal_id: Deal ID from broker
         """
-        self.position = {
-            'entry_price': entry_price,
-            'tp_level': tp_level,
-            'sl_level': sl_level,
-            'deal_id': deal_id
-        }
+        self._entry_price = float(entry_price)
+        self._set_activation_bid()
+        self._tp_level = tp_level
+        self._initial_sl = sl_level
+        self._deal_id = deal_id
         self.highest_bid = entry_price
         self.trailing_active = False
         self.current_sl_level = sl_level
+        self.refresh_log_levels()
 
-        self.logger.info(f"Trailing stop initialized: entry={entry_price:.2f}, "
-                        f"tp={tp_level:.2f}, initial_sl={sl_level:.2f}")
+        self.logger.info("Trailing stop initialized: entry=%.2f, tp=%.2f, initial_sl=%.2f",
+                         entry_price, tp_level, sl_level)
 
     def on_tick(self, bid: float) -> Tuple[bool, Optional[float], Optional[str]]:
         """
@@ -80,52 +100,112 @@ class TrailingStopManager:
             - new_sl_level: New SL level (if should_update_sl is True)
             - exit_reason: None (exits handled by IG, not locally)
         """
-        if not self.enabled or not self.position:
+        if not self.enabled or self._entry_price is None:
             return False, None, None
 
-        # Update highest bid if new high reached
-        if bid > self.highest_bid:
-            self.highest_bid = bid
-            self.logger.debug(f"New highest bid: {self.highest_bid:.2f}")
-
-        # Calculate current profit
-        current_profit = self.highest_bid - self.position['entry_price']
-
-        # Check if trailing stop should be activated
-        if not self.trailing_active and current_profit >= self.activation_pts:
-            self.trailing_active = True
-            self.logger.info(f"✓ Trailing stop ACTIVATED! Profit reached {current_profit:.2f} pts "
-                           f"(threshold: {self.activation_pts} pts)")
+        # Hot values kept in locals; attributes written back only when they change
+        highest_bid = self.highest_bid
+        if bid > highest_bid:
+            self.highest_bid = highest_bid = bid
+            if self._debug:
+                self.logger.debug("New highest bid: %.2f", highest_bid)
+
+        # Check if trailing stop should be activated. Dormant ticks (highest bid
+        # still below the cached activation price) stop here after one compare
+        trailing_active = self.trailing_active
+        if not trailing_active:
+            if highest_bid < self._activation_bid:
+                return False, None, None
+            self.trailing_active = trailing_active = True
+            if self._info:
+                self.logger.info("✓ Trailing stop ACTIVATED! Profit reached %.2f pts (threshold: %s pts)",
+                                 highest_bid - self._entry_price, self.activation_pts)
 
         # Calculate new SL if trailing is active
-        if self.trailing_active:
+        if trailing_active:
             # New SL = highest bid - distance
-            new_sl = self.highest_bid - self.distance_pts
+            new_sl = highest_bid - self.distance_pts
 
             # Only move SL UP (never down)
-            if new_sl > self.current_sl_level:
-                self.logger.debug(f"Trailing SL update needed: {self.current_sl_level:.2f} → {new_sl:.2f} "
-                                f"(+{new_sl - self.current_sl_level:.2f} pts)")
+            current_sl = self.current_sl_level
+            if new_sl > current_sl:
+                if self._debug:
+                    self.logger.debug("Trailing SL update needed: %.2f → %.2f (+%.2f pts)",
+                                      current_sl, new_sl, new_sl - current_sl)
                 self.current_sl_level = new_sl
                 return True, new_sl, None
 
         return False, None, None
 
+    def _set_activation_bid(self):
+        """
+        Cache the lowest highest_bid at which trailing activates.
+
+        Nudged to the exact float boundary of highest_bid - entry_price >= activation_pts,
+        so on_tick's single compare against it decides exactly like the profit check.
+        """
+        entry_price, activation_pts = self._entry_price, self.activation_pts
+        activation_bid = entry_price + activation_pts
+        while activation_bid - entry_price < activation_pts:
+            activation_bid = math.nextafter(activation_bid, math.inf)
+        while math.nextafter(activation_bid, -math.inf) - entry_price >= activation_pts:
+            activation_bid = math.nextafter(activation_bid, -math.inf)
+        self._activation_bid = activation_bid
+
+    @staticmethod
+    def simulate_series(bids: np.ndarray, entry_price: float, sl_level: float,
+                        activation_pts: float, distance_pts: float,
+                        highest_bid: Optional[float] = None, trailing_active: bool = False
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized on_tick over a whole bid series (backtests).
+
+        Same rules as calling on_tick once per bid: highest bid is a running
+        max, trailing activates once profit >= activation_pts and then stays
+        active, and the SL trails distance_pts behind the highest bid, only
+        ever moving up.
+
+        Args:
+            bids: Bid prices in tick order
+            entry_price: Position entry price
+            sl_level: Stop loss level before the first bid
+            activation_pts: Profit needed to activate trailing
+            distance_pts: Trailing distance behind highest bid
+            highest_bid: Highest bid before the first bid (default: entry_price)
+            trailing_active: Whether trailing was already active before the first bid
+
+        Returns:
+            Tuple of float64 (highest_bids, sl_levels) and bool trailing_active
+            arrays, each giving the state after processing that bid
+        """
+        if highest_bid is None:
+            highest_bid = entry_price
+
+        highest_bids = np.maximum.accumulate(np.maximum(bids, np.float64(highest_bid)))
+        active = (highest_bids - entry_price >= activation_pts) | trailing_active
+        candidate_sl = np.where(active, highest_bids - distance_pts, -np.inf)
+        sl_levels = np.maximum.accumulate(np.maximum(candidate_sl, sl_level))
+        return highest_bids, sl_levels, active
+
     def on_position_closed(self):
         """
         Reset tracking when position closes.
         """
-        if self.position:
-            self.logger.info(f"Trailing stop reset (position closed)")
-
-        self.position = None
+        if self._entry_price is not None:
+            self.logger.info("Trailing stop reset (position closed)")
+
+        self._entry_price = None
+        self._activation_bid = None
+        self._tp_level = None
+        self._initial_sl = None
+        self._deal_id = None
         self.highest_bid = None
         self.trailing_active = False
         self.current_sl_level = None
 
     def has_position(self) -> bool:
         """Check if currently tracking a position."""
-        return self.position is not None
+        return self._entry_price is not None
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -134,18 +214,18 @@ class TrailingStopManager:
         Returns:
             Status dictionary with current state
         """
-        if not self.position:
+        if self._entry_price is None:
             return {
                 'active': False,
                 'position': None
             }
 
-        current_profit = (self.highest_bid - self.position['entry_price']) if self.highest_bid else 0
+        current_profit = (self.highest_bid - self._entry_price) if self.highest_bid else 0
 
         return {
             'active': True,
             'trailing_active': self.trailing_active,
-            'entry_price': self.position['entry_price'],
+            'entry_price': self._entry_price,
             'highest_bid': self.highest_bid,
             'current_profit': current_profit,
             'current_sl': self.current_sl_level,
@@ -169,12 +249,12 @@ class TrailingStopManager:
         deal_id = saved_position['deal_id']
 
         # Restore position
-        self.position = {
-            'entry_price': entry_price,
-            'tp_level': tp_level,
-            'sl_level': sl_level,
-            'deal_id': deal_id
-        }
+        self._entry_price = float(entry_price)
+        self._set_activation_bid()
+        self._tp_level = tp_level
+        self._initial_sl = sl_level
+        self._deal_id = deal_id
+        self.refresh_log_levels()
 
         # Recalculate from current price
         current_profit = current_bid - entry_price
@@ -184,15 +264,11 @@ class TrailingStopManager:
             self.trailing_active = True
             self.highest_bid = current_bid
             self.current_sl_level = current_bid - self.distance_pts
-            self.logger.warning(f"Restored trailing stop (ACTIVE): "
-                              f"current_bid={current_bid:.2f}, "
-                              f"profit={current_profit:.2f}, "
-                              f"recalculated_sl={self.current_sl_level:.2f}")
+            self.logger.warning("Restored trailing stop (ACTIVE): current_bid=%.2f, profit=%.2f, "
+                                "recalculated_sl=%.2f", current_bid, current_profit, self.current_sl_level)
         else:
             self.trailing_active = False
             self.highest_bid = entry_price
             self.current_sl_level = sl_level
-            self.logger.warning(f"Restored trailing stop (INACTIVE): "
-                              f"current_bid={current_bid:.2f}, "
-                              f"profit={current_profit:.2f}, "
-                              f"original_sl={sl_level:.2f}")
+            self.logger.warning("Restored trailing stop (INACTIVE): current_bid=%.2f, profit=%.2f, "
+                                "original_sl=%.2f", current_bid, current_profit, sl_level)
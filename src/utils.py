@@ -1,17 +1,65 @@
 """Utility functions for configuration and logging."""
 
+import functools
 import logging
+import pickle
 import yaml
 from pathlib import Path
 from typing import Any, Dict
 from datetime import datetime
 import pytz
 
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml (C) parser
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Resolved once at import (get_ny_time may be called per tick)
+_NY_TZ = pytz.timezone('America/New_York')
+_UTC = pytz.UTC
+
+
+def load_config(config_path: str = "config.yaml", use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Load configuration from YAML file.
+
+    The parsed config is pickled next to the YAML file (config.yaml.pkl),
+    keyed by the YAML mtime, so repeated runs (e.g. TP sweeps) skip the parse.
+
+    Args:
+        config_path: Path to YAML config file
+        use_cache: Read/write the pickled cache
+
+    Returns:
+        Configuration dictionary
+    """
+    config_path = Path(config_path)
+    cache_path = config_path.with_name(config_path.name + '.pkl')
+    mtime_ns = config_path.stat().st_mtime_ns
+
+    if use_cache and cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('mtime_ns') == mtime_ns:
+                return cached['config']
+        except Exception:
+            pass  # Stale or corrupt cache - fall back to YAML
 
-def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
-    """Load configuration from YAML file."""
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=YamlLoader)
+
+    if use_cache:
+        # Atomic write (write to temp file, then rename)
+        temp_file = cache_path.with_suffix('.tmp')
+        try:
+            with open(temp_file, 'wb') as f:
+                pickle.dump({'mtime_ns': mtime_ns, 'config': config}, f)
+            temp_file.replace(cache_path)
+        except OSError:
+            pass  # Cache is optional (e.g. read-only config dir)
+
+    return config
 
 
 def get_market_config(config: Dict[str, Any], market_name: str = None) -> Dict[str, Any]:
@@ -96,21 +144,21 @@ def setup_logging(log_level: str = "INFO", log_file: str = None) -> logging.Logg
     return logger
 
 
+@functools.lru_cache(maxsize=128)
 def parse_time(time_str: str) -> tuple[int, int]:
-    """Parse time string 'HH:MM' to (hour, minute) tuple."""
+    """Parse time string 'HH:MM' to (hour, minute) tuple (memoized; few distinct strings)."""
     hour, minute = map(int, time_str.split(':'))
     return hour, minute
 
 
 def get_ny_time(dt: datetime = None) -> datetime:
     """Convert datetime to America/New_York timezone."""
-    tz = pytz.timezone('America/New_York')
     if dt is None:
-        return datetime.now(tz)
+        return datetime.now(_NY_TZ)
     if dt.tzinfo is None:
         # Assume UTC if no timezone
-        dt = pytz.UTC.localize(dt)
-    return dt.astimezone(tz)
+        dt = _UTC.localize(dt)
+    return dt.astimezone(_NY_TZ)
 
 
 def ensure_dir(path: str):
@@ -0,0 +1,145 @@
+"""Test vectorized tick kernels and session clock against their per-tick/scalar versions."""
+
+import logging
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.session_clock import SessionClock
+from src.tick_kernels import (
+    EXIT_NONE, EXIT_SL, EXIT_TP, EXIT_TRAILING_SL, scan_ticks_long, _scan_ticks_long_python
+)
+from src.trailing_stop_manager import TrailingStopManager
+
+# Setup logging (WARNING: the trailing manager logs every simulated position at INFO)
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+)
+
+ACTIVATION_PTS = 25.0
+DISTANCE_PTS = 10.0
+
+
+def reference_scan(bids, entry_price, sl_level, tp_level, use_trailing):
+    """Per-tick reference: TrailingStopManager.on_tick, then SL check, then TP check."""
+    manager = TrailingStopManager({
+        'use_trailing_stop': use_trailing,
+        'trailing_stop_activation_pts': ACTIVATION_PTS,
+        'trailing_stop_distance_pts': DISTANCE_PTS,
+    })
+    manager.on_position_opened(entry_price, tp_level, sl_level, 'TEST_DEAL')
+
+    for i, bid in enumerate(bids):
+        manager.on_tick(float(bid))
+        if bid <= manager.current_sl_level:
+            exit_code = EXIT_TRAILING_SL if manager.trailing_active else EXIT_SL
+            return i, manager.current_sl_level, exit_code, manager.highest_bid, \
+                manager.current_sl_level, manager.trailing_active
+        if bid >= tp_level:
+            return i, tp_level, EXIT_TP, manager.highest_bid, \
+                manager.current_sl_level, manager.trailing_active
+
+    return -1, np.nan, EXIT_NONE, manager.highest_bid, manager.current_sl_level, manager.trailing_active
+
+
+def random_bids(rng, entry_price, n):
+    """Drifting random walk of bids on a 0.1 pt grid (exact ties with SL/TP/activation happen)."""
+    steps = rng.choice([-1.0, -0.5, -0.1, 0.0, 0.1, 0.5, 1.0], size=n) + rng.choice([-0.1, 0.0, 0.1, 0.5])
+    return np.round(entry_price + np.cumsum(steps), 1)
+
+
+def check_scan(kernel, bids, entry_price, sl_level, tp_level, use_trailing):
+    """Compare one kernel run against the reference; returns the exit code."""
+    expected = reference_scan(bids, entry_price, sl_level, tp_level, use_trailing)
+    got = kernel(bids, sl_level, tp_level, entry_price, entry_price, False,
+                 use_trailing, ACTIVATION_PTS, DISTANCE_PTS)
+
+    assert int(got[0]) == expected[0], f"Exit index mismatch: {got[0]} != {expected[0]}"
+    assert int(got[2]) == expected[2], f"Exit code mismatch: {got[2]} != {expected[2]}"
+    if expected[0] >= 0:
+        assert got[1] == expected[1], f"Exit price mismatch: {got[1]} != {expected[1]}"
+    assert got[3] == expected[3], f"Highest bid mismatch: {got[3]} != {expected[3]}"
+    assert got[4] == expected[4], f"SL level mismatch: {got[4]} != {expected[4]}"
+    assert bool(got[5]) == expected[5], f"Trailing state mismatch: {got[5]} != {expected[5]}"
+    return expected[2]
+
+
+def main():
+    print("="*80)
+    print("TICK KERNEL / SESSION CLOCK EQUIVALENCE TEST")
+    print("="*80)
+    print()
+
+    rng = np.random.default_rng(42)
+    entry_price = 18000.0
+    sl_level = entry_price - 40.0
+    tp_level = entry_price + 60.0
+
+    kernels = [('scan_ticks_long', scan_ticks_long),
+               ('_scan_ticks_long_python', _scan_ticks_long_python)]
+
+    test_num = 1
+    for use_trailing in (False, True):
+        for name, kernel in kernels:
+            label = "trailing on" if use_trailing else "trailing off"
+            print(f"✓ Test {test_num}: {name} vs per-tick on_tick ({label})...")
+            codes = {}
+            for _ in range(300):
+                bids = random_bids(rng, entry_price, int(rng.integers(1, 3000)))
+                code = check_scan(kernel, bids, entry_price, sl_level, tp_level, use_trailing)
+                codes[code] = codes.get(code, 0) + 1
+            expected_codes = {EXIT_NONE, EXIT_SL, EXIT_TP} | ({EXIT_TRAILING_SL} if use_trailing else set())
+            assert set(codes) == expected_codes, f"Exit paths not all covered: {codes}"
+            print(f"  ✓ 300 random bid series match (exit codes: {dict(sorted(codes.items()))})")
+            print()
+            test_num += 1
+
+    # Session clock: 15-minute timestamps spanning the US (Mar 9) and EU (Mar 30) DST changes
+    timestamps = pd.Series(pd.date_range('2025-03-06', '2025-04-02', freq='15min'))
+    for tz, session_open, session_close in (('America/New_York', '09:30', '16:00'),
+                                            ('Europe/Berlin', '09:00', '17:30')):
+        clock = SessionClock({'tz': tz, 'session_open': session_open,
+                              'session_close': session_close, 'no_trade_first_minutes': 30})
+        dts = [ts.to_pydatetime() for ts in timestamps]
+
+        print(f"✓ Test {test_num}: filter_dataframe vs is_session_open/is_entry_allowed ({tz})...")
+        filtered = clock.filter_dataframe(pd.DataFrame({'timestamp': timestamps}))
+        session_rows = [i for i, dt in enumerate(dts) if clock.is_session_open(dt)]
+        assert list(filtered.index) == session_rows, "Session rows mismatch!"
+        expected_entry = [clock.is_entry_allowed(dts[i]) for i in session_rows]
+        assert filtered['entry_allowed'].tolist() == expected_entry, "Entry window mismatch!"
+        print(f"  ✓ {len(session_rows)} session rows, {sum(expected_entry)} entry-allowed")
+        print()
+        test_num += 1
+
+        print(f"✓ Test {test_num}: compute_eod_mask vs is_eod_bar ({tz})...")
+        for bar_minutes in (5, 30, 60):
+            eod_mask = clock.compute_eod_mask(timestamps, bar_minutes)
+            expected_eod = [clock.is_eod_bar(dt, bar_minutes) for dt in dts]
+            assert eod_mask.tolist() == expected_eod, f"EOD mask mismatch ({bar_minutes} min bars)!"
+        print("  ✓ 5/30/60 minute bars match")
+        print()
+        test_num += 1
+
+        print(f"✓ Test {test_num}: compute_trading_days vs get_trading_date ({tz})...")
+        days = clock.compute_trading_days(timestamps)
+        expected_days = [(clock.get_trading_date(dt) - date(1970, 1, 1)).days for dt in dts]
+        assert days.tolist() == expected_days, "Trading day mismatch!"
+        print(f"  ✓ {len(set(expected_days))} trading dates match")
+        print()
+        test_num += 1
+
+    print("="*80)
+    print("TICK KERNEL / SESSION CLOCK EQUIVALENCE - ALL TESTS PASSED ✓")
+    print("="*80)
+    print()
+    print("Summary:")
+    print("  ✓ Compiled and NumPy tick scans match per-tick on_tick (trailing on/off)")
+    print("  ✓ Vectorized session filter matches scalar checks across DST changes")
+    print("  ✓ Vectorized EOD mask and trading days match scalar versions")
+    print()
+
+if __name__ == '__main__':
+    main()